@@ -26,6 +26,11 @@ from core.search_scout import PropertySearcher, get_property_searcher
 
 logger = logging.getLogger(__name__)
 
+# Response parsing and file naming patterns
+_BHK_RE = re.compile(r'(\d+)\s*bhk')
+_SINGLE_DIGIT_BHK_RE = re.compile(r'\b([1-4])\b')
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\-]')
+
 
 class QualificationAgent:
     """
@@ -515,7 +520,7 @@ class QualificationAgent:
             summary: Qualification summary
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = re.sub(r'[^\w\-]', '_', session.lead.name)
+        safe_name = _UNSAFE_FILENAME_RE.sub('_', session.lead.name)
         base_filename = f"{timestamp}_{safe_name}_{session.session_id[:8]}"
         
         # Save transcript
@@ -694,12 +699,12 @@ class QualificationAgent:
         
         if property_type == PropertyType.RESIDENTIAL:
             # Look for BHK
-            bhk_match = re.search(r'(\d+)\s*bhk', response_lower)
+            bhk_match = _BHK_RE.search(response_lower)
             if bhk_match:
                 return f"{bhk_match.group(1)} BHK"
             
             # Look for just numbers
-            num_match = re.search(r'\b([1-4])\b', response_lower)
+            num_match = _SINGLE_DIGIT_BHK_RE.search(response_lower)
             if num_match:
                 return f"{num_match.group(1)} BHK"
             
@@ -10,6 +10,7 @@ Modules:
 - fallback: Gemini API integration
 - search_scout: realtyassistant.in web scraper
 - voice_handler: Voice call handler with accent/mispronunciation support
+- tts_engine: Cached text-to-speech for voice responses
 """
 
 from .whisper_engine import WhisperEngine
@@ -17,6 +18,7 @@ from .llm_engine import LLMEngine
 from .fallback import GeminiFallback
 from .search_scout import PropertySearcher
 from .voice_handler import VoiceHandler, get_voice_handler
+from .tts_engine import TTSEngine, get_tts_engine
 
 __all__ = [
     "WhisperEngine",
@@ -24,5 +26,7 @@ __all__ = [
     "GeminiFallback",
     "PropertySearcher",
     "VoiceHandler",
-    "get_voice_handler"
+    "get_voice_handler",
+    "TTSEngine",
+    "get_tts_engine"
 ]
@@ -14,10 +14,10 @@ from typing import Optional, List, Dict, Any
 from pathlib import Path
 import logging
 
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, Text, inspect, text
+from sqlalchemy import create_engine, event, Column, Integer, String, Boolean, DateTime, Text, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import StaticPool, QueuePool
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,17 @@ DATABASE_PATH = DATABASE_DIR / "leads.db"
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DATABASE_PATH}")
 Base = declarative_base()
 
+# Applied to every new SQLite connection. WAL lets reads proceed while a
+# lead is being written, and with WAL, synchronous=NORMAL stays durable
+# across crashes while skipping the fsync on every commit
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",       # ~20 MB page cache
+    "PRAGMA mmap_size=268435456",     # 256 MB memory-mapped reads
+    "PRAGMA busy_timeout=5000",       # wait up to 5 s for a lock
+)
+
 
 def ensure_data_directory():
     """Ensure the data directory exists."""
@@ -39,6 +50,29 @@ def ensure_data_directory():
         raise
 
 
+def _configure_sqlite(engine, in_memory: bool = False, read_only: bool = False):
+    """
+    Register a connect hook that tunes each SQLite connection.
+    
+    Args:
+        engine: SQLAlchemy engine for a SQLite database
+        in_memory: True for ':memory:' databases, which have no journal file
+        read_only: Reject writes on these connections (reader pool)
+    """
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            if not in_memory:
+                cursor.execute("PRAGMA journal_mode=WAL")
+            for pragma in _SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+            if read_only:
+                cursor.execute("PRAGMA query_only=TRUE")
+        finally:
+            cursor.close()
+
+
 class Lead(Base):
     """Lead model for storing qualified leads."""
     __tablename__ = "leads"
@@ -103,7 +137,16 @@ class Lead(Base):
 
 
 class LeadDatabase:
-    """Fail-safe database handler for leads."""
+    """
+    Fail-safe database handler for leads.
+    
+    File-backed SQLite gets one writer connection and a separate pool of
+    read-only connections, so lookups and listings run in parallel (WAL)
+    instead of queueing behind each other on a single shared connection.
+    """
+    
+    # Read-only SQLite connections kept open for lookups
+    READ_POOL_SIZE = 8
     
     def __init__(self, database_url: str = DATABASE_URL, max_retries: int = 3):
         """
@@ -117,6 +160,8 @@ class LeadDatabase:
         self.max_retries = max_retries
         self.engine = None
         self.SessionLocal = None
+        self.read_engine = None
+        self.ReadSessionLocal = None
         self._initialized = False
         self._initializing = False  # Guard against re-entry
         
@@ -133,6 +178,11 @@ class LeadDatabase:
             return Path(path_str)
         return None
     
+    @staticmethod
+    def _wal_files(db_path: Path) -> List[Path]:
+        """WAL-mode sidecar files that belong with the database file."""
+        return [db_path.with_name(db_path.name + suffix) for suffix in ("-wal", "-shm")]
+    
     def _check_database_integrity(self) -> bool:
         """Check if the SQLite database is corrupted."""
         db_path = self._get_db_path()
@@ -167,6 +217,10 @@ class LeadDatabase:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = db_path.parent / f"{db_path.stem}_backup_{timestamp}{db_path.suffix}"
             shutil.copy2(db_path, backup_path)
+            # Commits not yet checkpointed still live in the WAL
+            for sidecar in self._wal_files(db_path):
+                if sidecar.exists():
+                    shutil.copy2(sidecar, backup_path.with_name(backup_path.name + sidecar.name[len(db_path.name):]))
             logger.info(f"Database backed up to: {backup_path}")
             return backup_path
         except Exception as e:
@@ -212,8 +266,11 @@ class LeadDatabase:
                 # Backup first
                 self._backup_database()
                 
-                # Remove corrupted file
+                # Remove corrupted file, and its WAL so it isn't replayed
+                # into the fresh database
                 db_path.unlink()
+                for sidecar in self._wal_files(db_path):
+                    sidecar.unlink(missing_ok=True)
                 logger.info(f"Removed corrupted database: {db_path}")
             except Exception as e:
                 logger.error(f"Failed to remove database: {e}")
@@ -281,6 +338,8 @@ class LeadDatabase:
                     poolclass=StaticPool if "sqlite" in self.database_url else None,
                     pool_pre_ping=True  # Verify connections before use
                 )
+                if "sqlite" in self.database_url:
+                    _configure_sqlite(self.engine, in_memory=":memory:" in self.database_url)
                 
                 # Create all tables
                 Base.metadata.create_all(self.engine)
@@ -292,6 +351,7 @@ class LeadDatabase:
                     Base.metadata.create_all(self.engine)
                 
                 self.SessionLocal = sessionmaker(bind=self.engine)
+                self._create_read_engine()
                 
                 # Test connection directly (avoid get_session to prevent recursion)
                 test_session = self.SessionLocal()
@@ -342,6 +402,32 @@ class LeadDatabase:
         
         logger.info(f"Restored {restored}/{len(data)} leads after database repair")
     
+    def _create_read_engine(self):
+        """
+        Create the reader pool for file-backed SQLite.
+        
+        Other databases, and in-memory SQLite (where every new connection
+        would be a separate, empty database), read through the writer.
+        """
+        if self.read_engine is not None and self.read_engine is not self.engine:
+            self.read_engine.dispose()
+        
+        if "sqlite" not in self.database_url or ":memory:" in self.database_url:
+            self.read_engine = self.engine
+            self.ReadSessionLocal = self.SessionLocal
+            return
+        
+        self.read_engine = create_engine(
+            self.database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=QueuePool,
+            pool_size=self.READ_POOL_SIZE,
+            max_overflow=0,
+            pool_pre_ping=True
+        )
+        _configure_sqlite(self.read_engine, read_only=True)
+        self.ReadSessionLocal = sessionmaker(bind=self.read_engine)
+    
     def _create_fallback_database(self):
         """Create an in-memory fallback database."""
         try:
@@ -351,14 +437,28 @@ class LeadDatabase:
                 connect_args={"check_same_thread": False},
                 poolclass=StaticPool
             )
+            _configure_sqlite(self.engine, in_memory=True)
             Base.metadata.create_all(self.engine)
             self.SessionLocal = sessionmaker(bind=self.engine)
+            self._create_read_engine()
             self._initialized = True
             logger.warning("Running with in-memory database - data will not persist!")
         except Exception as e:
             logger.error(f"Failed to create fallback database: {e}")
             raise
     
+    def dispose(self):
+        """Close the reader pool and the writer engine's connections."""
+        try:
+            if self.read_engine is not None and self.read_engine is not self.engine:
+                self.read_engine.dispose()
+            if self.engine is not None:
+                self.engine.dispose()
+        except Exception as e:
+            logger.warning(f"Error disposing database engines: {e}")
+        self.read_engine = None
+        self.ReadSessionLocal = None
+    
     def is_healthy(self) -> bool:
         """Check if the database is healthy and operational."""
         if not self._initialized:
@@ -384,12 +484,22 @@ class LeadDatabase:
         
         return self.SessionLocal()
     
+    def get_write_session(self) -> Session:
+        """Get a session on the single writer connection."""
+        return self.get_session()
+    
+    def get_read_session(self) -> Session:
+        """Get a session from the read-only pool (writes are rejected)."""
+        if not self.ReadSessionLocal:
+            return self.get_session()
+        return self.ReadSessionLocal()
+    
     def create_lead(self, lead_data: Dict[str, Any]) -> Lead:
         """Create a new lead or update existing one by session_id."""
         if not self._initialized:
             self._initialize_with_retry()
         
-        with self.get_session() as session:
+        with self.get_write_session() as session:
             try:
                 # Ensure session_id exists
                 session_id = lead_data.get("session_id")
@@ -458,7 +568,7 @@ class LeadDatabase:
             self._initialize_with_retry()
         
         try:
-            with self.get_session() as session:
+            with self.get_read_session() as session:
                 lead = session.query(Lead).filter(Lead.session_id == session_id).first()
                 return lead.to_dict() if lead else None
         except Exception as e:
@@ -471,7 +581,7 @@ class LeadDatabase:
             self._initialize_with_retry()
         
         try:
-            with self.get_session() as session:
+            with self.get_read_session() as session:
                 lead = session.query(Lead).filter(Lead.id == lead_id).first()
                 return lead.to_dict() if lead else None
         except Exception as e:
@@ -489,7 +599,7 @@ class LeadDatabase:
             self._initialize_with_retry()
         
         try:
-            with self.get_session() as session:
+            with self.get_read_session() as session:
                 query = session.query(Lead)
                 
                 if qualified_only:
@@ -522,7 +632,7 @@ class LeadDatabase:
             self._initialize_with_retry()
         
         try:
-            with self.get_session() as session:
+            with self.get_read_session() as session:
                 query = session.query(Lead)
                 if qualified_only:
                     query = query.filter(Lead.qualified == True)
@@ -537,7 +647,7 @@ class LeadDatabase:
             self._initialize_with_retry()
         
         try:
-            with self.get_session() as session:
+            with self.get_write_session() as session:
                 lead = session.query(Lead).filter(Lead.session_id == session_id).first()
                 if lead:
                     session.delete(lead)
@@ -594,6 +704,8 @@ def get_database() -> LeadDatabase:
         _db_instance = LeadDatabase()
     elif not _db_instance.is_healthy():
         logger.warning("Database unhealthy, reinitializing...")
+        # Release the old instance's pooled connections before replacing it
+        _db_instance.dispose()
         _db_instance = LeadDatabase()
     
     return _db_instance
@@ -114,6 +114,28 @@ class LLMEngine:
         
         return self._initialized
     
+    async def warmup(self) -> bool:
+        """
+        Load the local model into memory ahead of the first real request.
+        
+        Ollama loads a model lazily, so the first call after startup pays
+        the load time and usually overruns timeout_seconds, falling back
+        to Gemini. An empty prompt loads the model without generating.
+        
+        Returns:
+            True if the model is loaded
+        """
+        if not self._ollama_available or self._ollama_client is None:
+            return False
+        
+        try:
+            await self._ollama_client.generate(model=self.ollama_model, prompt="")
+            logger.info(f"Ollama model warmed: {self.ollama_model}")
+            return True
+        except Exception as e:
+            logger.warning(f"Ollama warmup failed: {e}")
+            return False
+    
     async def _check_ollama(self) -> bool:
         """
         Check if Ollama is running and the model is available.
@@ -10,18 +10,324 @@ import os
 import re
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+import time
+import inspect
+import threading
+import importlib.util
+from typing import Optional, Dict, Any, List, AsyncIterator, Awaitable, Callable, TypedDict, Union
 from dataclasses import dataclass
+from collections import OrderedDict
 from urllib.parse import urlencode, quote_plus
 
 logger = logging.getLogger(__name__)
 
+# Project status labels shown on property cards, matched in a single pass
+_STATUS_RE = re.compile(r'(New Launch|Ready [Tt]o [Mm]ove(?: in)?|Under Construction|Launching soon)')
+_STATUS_NORM = {
+    'ready to move': 'Ready to move in',
+    'ready to move in': 'Ready to move in',
+}
 
-@dataclass
+# "<n> bhk" in a requested topology
+_TOPOLOGY_BHK_RE = re.compile(r'(\d+)\s*bhk')
+
+# Listing container on the search page: id="property", or "properties" as a
+# whole class token (not "featured-properties")
+_LISTING_CONTAINER_RE = re.compile(
+    r'id=["\']property["\']|class=["\'](?:[^"\']*\s)?properties(?=[\s"\'])'
+)
+
+# Budget parsing: filler words, thousands separators, and "<number> <unit>" tokens
+_LAKH = 100000
+_CRORE = 10000000
+_BUDGET_FILLER_RE = re.compile(
+    r'\b(?:around|approximately|about|give or take|roughly|maybe|nearly|almost)\b'
+)
+_BUDGET_THOUSANDS_RE = re.compile(r'(\d),(\d)')
+_BUDGET_TOKEN_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(crore|cr|lakh|lac|k\b)?')
+_BUDGET_UNITS = {
+    'crore': _CRORE,
+    'cr': _CRORE,
+    'lakh': _LAKH,
+    'lac': _LAKH,
+    'k': 1000,
+}
+
+# Link-scan fallback run in the page: first 30 property links, titled, deduplicated
+_FALLBACK_LINKS_JS = """
+() => {
+    const items = Array.from(document.querySelectorAll('a[href*="/property/"]'))
+        .slice(0, 30)
+        .map(a => ({title: (a.innerText || '').trim(), link: a.href}))
+        .filter(p => p.link.includes('/property/') && p.title.length > 5);
+    const seen = new Set();
+    return items.filter(p => !seen.has(p.link) && seen.add(p.link));
+}
+"""
+
+# In-process cache for static assets served through context.route().
+# Bundle JS/CSS/fonts are identical across property queries, so repeat
+# searches can be fulfilled locally instead of hitting the network.
+_ASSET_CACHE_TYPES = frozenset(('script', 'stylesheet', 'font'))
+# Only these URLs are routed; documents, images and XHR stay on the
+# browser's normal path instead of round-tripping through Python
+_ASSET_URL_RE = re.compile(r'\.(?:js|css|woff2?|ttf|otf)(?:[?#]|$)', re.IGNORECASE)
+_ASSET_CACHE_MAX_ENTRIES = 256
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+# Body is handed back already decoded, so transfer headers must not be replayed
+_UNCACHED_HEADERS = frozenset(('content-encoding', 'content-length', 'transfer-encoding'))
+_asset_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _cache_ttl(cache_control: str) -> int:
+    """Return the cacheable lifetime in seconds from a Cache-Control header (0 = don't cache)."""
+    cache_control = cache_control.lower()
+    if 'no-store' in cache_control or 'no-cache' in cache_control or 'private' in cache_control:
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+async def _route_with_asset_cache(route):
+    """Route handler serving fresh cached static assets and caching new ones."""
+    request = route.request
+    
+    if request.method != 'GET' or request.resource_type not in _ASSET_CACHE_TYPES:
+        await route.continue_()
+        return
+    
+    url = request.url
+    cached = _asset_cache.get(url)
+    if cached is not None:
+        status, headers, body, expires_at = cached
+        if expires_at > time.monotonic():
+            _asset_cache.move_to_end(url)
+            await route.fulfill(status=status, headers=headers, body=body)
+            return
+        del _asset_cache[url]
+    
+    try:
+        response = await route.fetch()
+    except Exception as e:
+        logger.debug(f"Asset fetch failed for {url}: {e}")
+        await route.continue_()
+        return
+    
+    ttl = _cache_ttl(response.headers.get('cache-control', '')) if response.status == 200 else 0
+    if ttl > 0:
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in _UNCACHED_HEADERS
+        }
+        _asset_cache[url] = (response.status, headers, await response.body(), time.monotonic() + ttl)
+        if len(_asset_cache) > _ASSET_CACHE_MAX_ENTRIES:
+            _asset_cache.popitem(last=False)
+    
+    await route.fulfill(response=response)
+
+
+# Resolves once the number of .property_item cards is unchanged across two
+# consecutive polls (state kept on window between polls). An empty count must
+# hold for five polls, since cards may still be on their way from the API.
+_CARDS_STABLE_JS = """
+() => {
+    const n = document.querySelectorAll('.property_item').length;
+    window.__stablePolls = n === window.__lastN ? (window.__stablePolls || 0) + 1 : 0;
+    window.__lastN = n;
+    return window.__stablePolls >= (n > 0 ? 1 : 5);
+}
+"""
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+    'AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/120.0.0.0 Safari/537.36'
+)
+
+# Shared keep-alive HTTP client for lightweight (non-browser) requests.
+# Reusing one pool avoids a TCP+TLS handshake per request.
+# One client per event loop: an AsyncClient's pooled connections are bound
+# to the loop that opened them, so sharing one across loops breaks the pool.
+_HTTP_CLIENTS: Dict[int, tuple] = {}
+
+
+def get_http_client():
+    """
+    Get the shared httpx.AsyncClient for the running loop, creating it on first use.
+    
+    Returns:
+        httpx.AsyncClient with a keep-alive connection pool
+    """
+    loop = asyncio.get_running_loop()
+    
+    # Forget clients whose loop has gone away (its id may be reused)
+    for stale_id in [k for k, (owner, _) in _HTTP_CLIENTS.items() if owner.is_closed()]:
+        del _HTTP_CLIENTS[stale_id]
+    
+    entry = _HTTP_CLIENTS.get(id(loop))
+    if entry is None or entry[1].is_closed:
+        import httpx
+        
+        client = httpx.AsyncClient(
+            http2=importlib.util.find_spec('h2') is not None,
+            timeout=15,
+            headers={'User-Agent': USER_AGENT},
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+        )
+        entry = _HTTP_CLIENTS[id(loop)] = (loop, client)
+    
+    return entry[1]
+
+
+async def close_http_client():
+    """Close the running loop's HTTP client. Call once at app shutdown."""
+    entry = _HTTP_CLIENTS.pop(id(asyncio.get_running_loop()), None)
+    if entry is not None and not entry[1].is_closed:
+        await entry[1].aclose()
+
+
+# Chromium launch flags. Disabling background services (sync, translate,
+# extensions, component updates) leaves more CPU for the render path.
+_CHROMIUM_ARGS = (
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--disable-gpu',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-features=TranslateUI',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-extensions',
+)
+
+# One Chromium per event loop and headless mode, shared by every
+# PropertySearcher on that loop (Playwright objects are bound to the loop
+# that created them). Each entry is reference-counted by the searchers
+# using it, so one searcher closing never pulls the browser from another.
+class _SharedBrowser:
+    """A Chromium instance, its Playwright driver, and its user count."""
+    __slots__ = ('playwright', 'browser', 'loop', 'refs')
+    
+    def __init__(self, playwright, browser, loop):
+        self.playwright = playwright
+        self.browser = browser
+        self.loop = loop
+        self.refs = 0
+    
+    async def close(self):
+        """Close the browser and stop Playwright, ignoring dead handles."""
+        try:
+            await self.browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing shared browser: {e}")
+        try:
+            await self.playwright.stop()
+        except Exception as e:
+            logger.debug(f"Error stopping Playwright: {e}")
+
+
+_SHARED_BROWSERS: Dict[tuple, _SharedBrowser] = {}
+
+
+# Per-loop lock held across the check-and-launch below, so concurrent first
+# searches on one loop wait for a single Chromium instead of each starting one
+_SHARED_BROWSER_LOCKS: Dict[int, tuple] = {}
+
+
+def _shared_browser_lock() -> asyncio.Lock:
+    """Get the launch lock for the running loop."""
+    loop = asyncio.get_running_loop()
+    
+    for stale_id in [k for k, (owner, _) in _SHARED_BROWSER_LOCKS.items() if owner.is_closed()]:
+        del _SHARED_BROWSER_LOCKS[stale_id]
+    
+    entry = _SHARED_BROWSER_LOCKS.get(id(loop))
+    if entry is None:
+        entry = _SHARED_BROWSER_LOCKS[id(loop)] = (loop, asyncio.Lock())
+    return entry[1]
+
+
+async def _acquire_shared_browser(headless: bool) -> _SharedBrowser:
+    """
+    Get the Chromium instance for the running loop, launching it on first use.
+    
+    Each call takes a reference that must be returned with
+    _release_shared_browser().
+    
+    Args:
+        headless: Run browser in headless mode
+        
+    Returns:
+        The shared browser entry
+    """
+    loop = asyncio.get_running_loop()
+    key = (id(loop), headless)
+    
+    async with _shared_browser_lock():
+        # Forget entries whose loop has gone away (its id may be reused)
+        for stale_key in [k for k, entry in _SHARED_BROWSERS.items() if entry.loop.is_closed()]:
+            del _SHARED_BROWSERS[stale_key]
+        
+        entry = _SHARED_BROWSERS.get(key)
+        if entry is not None and not entry.browser.is_connected():
+            # Crashed underneath us: reap it and launch a replacement. Searchers
+            # still holding the dead entry release it when they reconnect.
+            del _SHARED_BROWSERS[key]
+            await entry.close()
+            entry = None
+        
+        if entry is None:
+            from playwright.async_api import async_playwright
+            
+            playwright = await async_playwright().start()
+            browser = await playwright.chromium.launch(
+                headless=headless,
+                args=list(_CHROMIUM_ARGS)
+            )
+            entry = _SharedBrowser(playwright, browser, loop)
+            _SHARED_BROWSERS[key] = entry
+        
+        entry.refs += 1
+        return entry
+
+
+async def _release_shared_browser(entry: _SharedBrowser):
+    """Drop one reference; the last one closes the browser."""
+    entry.refs -= 1
+    if entry.refs > 0:
+        return
+    
+    for key, current in list(_SHARED_BROWSERS.items()):
+        if current is entry:
+            del _SHARED_BROWSERS[key]
+    await entry.close()
+
+
+class PropertyItem(TypedDict, total=False):
+    """A single property listing extracted from a search page."""
+    index: int
+    title: str
+    link: str
+    location: str
+    area: str
+    price: str
+    status: str
+    image: str
+
+
+# Per-property callback used to stream results as they are extracted
+ResultCallback = Callable[[PropertyItem], Union[None, Awaitable[None]]]
+
+
+@dataclass(slots=True, frozen=True)
 class PropertySearchResult:
     """Result from property search."""
     count: int
-    properties: List[Dict[str, Any]]
+    properties: List[PropertyItem]
     query_params: Dict[str, Any]
     success: bool
     error: Optional[str] = None
@@ -43,18 +349,27 @@ class PropertySearcher:
     BASE_URL = "https://realtyassistant.in"
     SEARCH_TIMEOUT = 45000  # 45 seconds
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, preflight: bool = False):
         """
         Initialize the property searcher.
         
         Args:
             headless: Run browser in headless mode
+            preflight: Probe the raw search HTML over plain HTTP and skip the
+                browser when it has no listings. Off by default: if cards are
+                rendered client-side, the server HTML is an empty container
+                shell and real results would be reported as empty. Only
+                enable against a site known to render listings server-side.
         """
         self.headless = headless
+        self.preflight = preflight
         self._browser = None
         self._context = None
         self._playwright = None
+        self._shared: Optional[_SharedBrowser] = None
         self._initialized = False
+        self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bg_lock = threading.Lock()
     
     async def initialize(self) -> bool:
         """
@@ -64,22 +379,22 @@ class PropertySearcher:
             True if initialization successful
         """
         if self._initialized:
-            return True
+            if self._shared is None or self._shared.browser.is_connected():
+                return True
+            # Shared browser died; swap our reference for its replacement
+            shared, self._shared = self._shared, None
+            self._initialized = False
+            await _release_shared_browser(shared)
             
         try:
-            from playwright.async_api import async_playwright
+            shared = await _acquire_shared_browser(self.headless)
+            if self._initialized:
+                # A concurrent caller finished first; keep only its reference
+                await _release_shared_browser(shared)
+                return True
             
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--disable-gpu'
-                ]
-            )
+            self._shared = shared
+            self._playwright, self._browser = shared.playwright, shared.browser
             # Context is now created per-request
             # self._context = await self._browser.new_context(...)
             
@@ -102,7 +417,8 @@ class PropertySearcher:
         budget_min: Optional[int] = None,
         budget_max: Optional[int] = None,
         project_status: Optional[str] = None,
-        possession: Optional[str] = None
+        possession: Optional[str] = None,
+        on_result: Optional[ResultCallback] = None
     ) -> PropertySearchResult:
         """
         Search for properties on realtyassistant.in.
@@ -115,65 +431,68 @@ class PropertySearcher:
             budget_max: Maximum budget in INR
             project_status: Launching soon, New Launch, Under Construction, Ready to move in
             possession: 3 Months, 6 Months, 1 year, 2+ years, Ready To Move
+            on_result: Optional callback receiving each property as soon as it
+                is extracted, so callers can render the first listing early
             
         Returns:
             PropertySearchResult with matching properties
         """
-        if not self._initialized:
-            if not await self.initialize():
-                return PropertySearchResult(
-                    count=0,
-                    properties=[],
-                    query_params={},
-                    success=False,
-                    error="Browser initialization failed"
-                )
+        query_params = {
+            "location": location,
+            "property_type": property_type,
+            "topology": topology,
+            "budget_min": budget_min,
+            "budget_max": budget_max,
+            "project_status": project_status,
+            "possession": possession
+        }
         
-        try:
-            # Build search URL
-            search_url = self._build_search_url(
-                location, property_type, topology, budget_min, budget_max,
-                project_status, possession
+        # Build search URL
+        search_url = self._build_search_url(
+            location, property_type, topology, budget_min, budget_max,
+            project_status, possession
+        )
+        
+        # Cheap HTTP probe first - empty result pages never need a browser
+        if self.preflight and await self._preflight_is_empty(search_url):
+            logger.info(f"Preflight found no listings, skipping browser: {search_url}")
+            return PropertySearchResult(
+                count=0,
+                properties=[],
+                query_params=query_params,
+                success=True,
+                source_url=search_url
             )
-            
+        
+        if not await self.initialize():
+            return PropertySearchResult(
+                count=0,
+                properties=[],
+                query_params={},
+                success=False,
+                error="Browser initialization failed"
+            )
+        
+        try:
             logger.info(f"Searching: {search_url}")
             
             # Create new context for this search (auto-create session)
-            context = await self._browser.new_context(
-                viewport={'width': 1280, 'height': 720},
-                user_agent=(
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                    'AppleWebKit/537.36 (KHTML, like Gecko) '
-                    'Chrome/120.0.0.0 Safari/537.36'
-                )
-            )
+            context = await self._new_context()
             
             try:
                 # Perform search
                 page = await context.new_page()
                 
                 try:
-                    await page.goto(search_url, timeout=self.SEARCH_TIMEOUT)
-                    # Use domcontentloaded instead of networkidle for faster/more reliable loading
-                    await page.wait_for_load_state("domcontentloaded", timeout=self.SEARCH_TIMEOUT)
-                    # Give a small delay for dynamic content
-                    await page.wait_for_timeout(3000)
+                    await self._load_search_page(page, search_url)
                     
                     # Extract property count and listings
-                    count, properties = await self._extract_results(page)
+                    count, properties = await self._extract_results(page, on_result)
                     
                     return PropertySearchResult(
                         count=count,
                         properties=properties,
-                        query_params={
-                            "location": location,
-                            "property_type": property_type,
-                            "topology": topology,
-                            "budget_min": budget_min,
-                            "budget_max": budget_max,
-                            "project_status": project_status,
-                            "possession": possession
-                        },
+                        query_params=query_params,
                         success=True,
                         source_url=search_url
                     )
@@ -190,19 +509,145 @@ class PropertySearcher:
             return PropertySearchResult(
                 count=0,
                 properties=[],
-                query_params={
-                    "location": location,
-                    "property_type": property_type,
-                    "topology": topology,
-                    "budget_min": budget_min,
-                    "budget_max": budget_max,
-                    "project_status": project_status,
-                    "possession": possession
-                },
+                query_params=query_params,
                 success=False,
                 error=str(e)
             )
     
+    async def search_many(self, queries: List[Dict[str, Any]]) -> List[PropertySearchResult]:
+        """
+        Run several searches, overlapping page loads with extraction.
+        
+        Two pages in one browser context ping-pong: while results are being
+        extracted from one page, the next query is already navigating on the
+        other, so network wait hides behind extraction work.
+        
+        Args:
+            queries: Keyword-argument dicts accepted by search()
+            (location, property_type, topology, budget_min, budget_max,
+            project_status, possession)
+            
+        Returns:
+            List of PropertySearchResult, in the same order as queries
+        """
+        if not queries:
+            return []
+        
+        param_names = (
+            "location", "property_type", "topology", "budget_min",
+            "budget_max", "project_status", "possession"
+        )
+        params_list = [{name: query.get(name) for name in param_names} for query in queries]
+        
+        if not await self.initialize():
+            return [
+                PropertySearchResult(
+                    count=0,
+                    properties=[],
+                    query_params=params,
+                    success=False,
+                    error="Browser initialization failed"
+                )
+                for params in params_list
+            ]
+        
+        urls = [self._build_search_url(**params) for params in params_list]
+        results: List[PropertySearchResult] = []
+        pending = None
+        
+        context = await self._new_context()
+        
+        try:
+            pages = [await context.new_page(), await context.new_page()]
+            pending = asyncio.ensure_future(self._load_search_page(pages[0], urls[0]))
+            
+            for i, params in enumerate(params_list):
+                page = pages[i % 2]
+                
+                try:
+                    await pending
+                    load_error = None
+                except Exception as e:
+                    load_error = e
+                
+                # Start the next navigation before extracting this page
+                if i + 1 < len(urls):
+                    pending = asyncio.ensure_future(
+                        self._load_search_page(pages[(i + 1) % 2], urls[i + 1])
+                    )
+                else:
+                    pending = None
+                
+                if load_error is not None:
+                    logger.error(f"Search error: {load_error}")
+                    results.append(PropertySearchResult(
+                        count=0,
+                        properties=[],
+                        query_params=params,
+                        success=False,
+                        error=str(load_error)
+                    ))
+                    continue
+                
+                count, properties = await self._extract_results(page)
+                results.append(PropertySearchResult(
+                    count=count,
+                    properties=properties,
+                    query_params=params,
+                    success=True,
+                    source_url=urls[i]
+                ))
+            
+            return results
+        
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+            await context.close()
+    
+    async def _new_context(self):
+        """Create a browser context with the shared static-asset cache installed."""
+        context = await self._browser.new_context(
+            viewport={'width': 1280, 'height': 720},
+            user_agent=USER_AGENT
+        )
+        await context.route(_ASSET_URL_RE, _route_with_asset_cache)
+        return context
+    
+    async def _load_search_page(self, page, search_url: str):
+        """Navigate a page to a search URL and wait for listings to render."""
+        await page.goto(search_url, timeout=self.SEARCH_TIMEOUT)
+        # Use domcontentloaded instead of networkidle for faster/more reliable loading
+        await page.wait_for_load_state("domcontentloaded", timeout=self.SEARCH_TIMEOUT)
+    
+    async def _preflight_is_empty(self, search_url: str) -> bool:
+        """
+        Check the raw search page over plain HTTP for listings.
+        
+        Only reports empty when the listing container is present but holds
+        no property cards; any error or unexpected page falls through to
+        the full browser search. This cannot tell a server-rendered empty
+        result from a shell awaiting client-side cards, which is why the
+        probe only runs when the searcher is created with preflight=True.
+        
+        Args:
+            search_url: Search URL built by _build_search_url
+            
+        Returns:
+            True if the page definitely has no listings
+        """
+        try:
+            response = await get_http_client().get(search_url)
+            if response.status_code != 200:
+                return False
+            
+            html = response.text
+            return bool(_LISTING_CONTAINER_RE.search(html)) and 'property_item' not in html
+            
+        except Exception as e:
+            logger.debug(f"Preflight probe failed, using browser: {e}")
+            return False
+    
     # City ID mapping for realtyassistant.in
     CITY_IDS = {
         'noida': 10,
@@ -298,7 +743,7 @@ class PropertySearcher:
         # Bedroom/Typology
         if topology:
             topology_lower = topology.lower()
-            bhk_match = re.search(r'(\d+)\s*bhk', topology_lower)
+            bhk_match = _TOPOLOGY_BHK_RE.search(topology_lower)
             if bhk_match:
                 bhk_num = int(bhk_match.group(1))
                 if bhk_num <= 5:
@@ -326,9 +771,36 @@ class PropertySearcher:
 
 
     
-    async def _extract_results(self, page) -> tuple:
+    async def _extract_results(self, page, on_result: Optional[ResultCallback] = None) -> tuple:
         """
         Extract property count and listings from realtyassistant.in.
+        
+        Args:
+            page: Playwright page object
+            on_result: Optional callback invoked with each property as soon
+                as it is extracted (may be sync or async)
+            
+        Returns:
+            Tuple of (count, properties list with unique links)
+        """
+        properties = []
+        
+        async for property_info in self._iter_results(page):
+            properties.append(property_info)
+            if on_result is not None:
+                callback_result = on_result(property_info)
+                if inspect.isawaitable(callback_result):
+                    await callback_result
+        
+        # Always use the actual unique properties count - this is the true count
+        # The DOM element count can include duplicates and mandate/booking properties
+        final_count = len(properties)
+        logger.info(f"Extracted {final_count} unique properties from #home tab")
+        return final_count, properties
+    
+    async def _iter_results(self, page) -> AsyncIterator[PropertyItem]:
+        """
+        Yield property listings from realtyassistant.in one card at a time.
         Uses exact selectors matching the site's HTML structure.
         
         HTML Structure (from site):
@@ -343,25 +815,32 @@ class PropertySearcher:
         Args:
             page: Playwright page object
             
-        Returns:
-            Tuple of (count, properties list with unique links)
+        Yields:
+            Property dicts with unique links, in page order
         """
-        count = 0
-        properties = []
+        yielded = 0
         seen_urls = set()  # Track unique URLs to avoid duplicates
         
         try:
             # Wait for the property container to load first
             await page.wait_for_selector('#property, .properties', timeout=10000)
             
-            # Give additional time for dynamic content
-            await page.wait_for_timeout(2000)
-            
-            # Wait for actual property items to appear
+            # Wait until the rendered card count stops changing between polls,
+            # instead of sleeping a fixed interval for dynamic content
             try:
-                await page.wait_for_selector('.property_item', timeout=10000)
-            except:
-                logger.warning("No .property_item found, trying alternate selectors")
+                await page.wait_for_function(
+                    _CARDS_STABLE_JS,
+                    polling=200,
+                    timeout=5000
+                )
+            except Exception:
+                logger.debug("Property card count did not stabilize within 5s")
+                
+                # Still loading - wait for actual property items to appear
+                try:
+                    await page.wait_for_selector('.property_item', timeout=10000)
+                except:
+                    logger.warning("No .property_item found, trying alternate selectors")
             
             # Get property cards from the ACTIVE "All Projects" tab (#home) ONLY
             # The page has two tabs: #home (All Projects) and #mandatory (Mandate Projects)
@@ -385,7 +864,7 @@ class PropertySearcher:
             # Extract property details from each card
             for i, elem in enumerate(elements[:10]):  # Limit to 10 for performance
                 try:
-                    property_info = {'index': i + 1}
+                    property_info: PropertyItem = {'index': i + 1}
                     
                     # Get title and link from h2.property-name-wrap a
                     # Exact HTML: <h2 class="property-name-wrap"><a href="...">Title</a></h2>
@@ -449,32 +928,15 @@ class PropertySearcher:
                     # Get status (possession/construction status)
                     # HTML has span with class like "possesion=wrap" (note the typo in the site)
                     # Near <i class="icon-document-time"> icon
-                    status_found = False
-                    
-                    # First try to get all prop-price-wrap elements and look for status text
                     prop_wraps = await elem.query_selector_all('.prop-price-wrap')
                     for wrap in prop_wraps:
                         try:
                             wrap_text = await wrap.inner_text()
-                            if wrap_text:
-                                wrap_text = wrap_text.strip()
-                                # Check for common status keywords
-                                if 'New Launch' in wrap_text:
-                                    property_info['status'] = 'New Launch'
-                                    status_found = True
-                                    break
-                                elif 'Ready to move' in wrap_text or 'Ready To Move' in wrap_text:
-                                    property_info['status'] = 'Ready to move in'
-                                    status_found = True
-                                    break
-                                elif 'Under Construction' in wrap_text:
-                                    property_info['status'] = 'Under Construction'
-                                    status_found = True
-                                    break
-                                elif 'Launching soon' in wrap_text:
-                                    property_info['status'] = 'Launching soon'
-                                    status_found = True
-                                    break
+                            status_match = _STATUS_RE.search(wrap_text) if wrap_text else None
+                            if status_match:
+                                status = status_match.group(1)
+                                property_info['status'] = _STATUS_NORM.get(status.lower(), status)
+                                break
                         except:
                             continue
                     
@@ -488,7 +950,8 @@ class PropertySearcher:
                     
                     # Only add if we have title and link
                     if property_info.get('title') and property_info.get('link'):
-                        properties.append(property_info)
+                        yielded += 1
+                        yield property_info
                         logger.debug(f"Extracted property {i+1}: {property_info.get('title', 'No title')}")
                         
                 except Exception as e:
@@ -496,52 +959,48 @@ class PropertySearcher:
                     continue
             
             # Fallback: if no properties extracted from cards, try to get links directly
-            if len(properties) == 0:
+            if yielded == 0:
                 logger.info("Card extraction failed, trying link fallback")
-                all_links = await page.query_selector_all('a[href*="/property/"]')
-                unique_properties_from_links = []
+                # One evaluate round-trip instead of two per link; a.href is
+                # already absolute and links are deduplicated in the page
+                links = await page.evaluate(_FALLBACK_LINKS_JS)
                 
-                for link_elem in all_links[:30]:  # Check more links
-                    try:
-                        href = await link_elem.get_attribute('href')
-                        if href and '/property/' in href and href not in seen_urls:
-                            if not href.startswith('http'):
-                                href = f"https://realtyassistant.in{href}"
-                            
-                            title = await link_elem.inner_text()
-                            if title and title.strip() and len(title.strip()) > 5:  # Filter out short non-title text
-                                seen_urls.add(href)
-                                unique_properties_from_links.append({
-                                    'index': len(unique_properties_from_links) + 1,
-                                    'title': title.strip(),
-                                    'link': href,
-                                    'price': '₹On Request'
-                                })
-                    except:
+                for link in links:
+                    if yielded >= 10:
+                        break
+                    href = link['link']
+                    if href in seen_urls:
                         continue
+                    seen_urls.add(href)
+                    yielded += 1
+                    yield {
+                        'index': yielded,
+                        'title': link['title'],
+                        'link': href,
+                        'price': '₹On Request'
+                    }
                 
-                # Take unique properties only
-                properties = unique_properties_from_links[:10]
-                logger.info(f"Fallback extracted {len(properties)} properties from links")
+                logger.info(f"Fallback extracted {yielded} properties from links")
                 
         except Exception as e:
             logger.error(f"Error extracting results: {e}")
-        
-        # Always use the actual unique properties count - this is the true count
-        # The DOM element count can include duplicates and mandate/booking properties
-        final_count = len(properties)
-        logger.info(f"Extracted {final_count} unique properties from #home tab")
-        return final_count, properties
     
     async def close(self):
         """Close the browser and cleanup resources."""
         try:
             # if self._context:
             #     await self._context.close()
-            if self._browser:
-                await self._browser.close()
-            if self._playwright:
-                await self._playwright.stop()
+            if self._shared is not None:
+                # Other searchers may still be using the shared browser
+                shared, self._shared = self._shared, None
+                await _release_shared_browser(shared)
+            else:
+                if self._browser:
+                    await self._browser.close()
+                if self._playwright:
+                    await self._playwright.stop()
+            self._browser = None
+            self._playwright = None
             
             self._initialized = False
             logger.info("Browser closed")
@@ -574,16 +1033,31 @@ class PropertySearcher:
         Returns:
             PropertySearchResult
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(
+        future = asyncio.run_coroutine_threadsafe(
             self.search(location, property_type, topology, budget_min, budget_max,
-                       project_status, possession)
+                        project_status, possession),
+            self._get_background_loop()
         )
+        return future.result()
+    
+    def _get_background_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the persistent event loop used by search_sync.
+        
+        The loop runs forever in a daemon thread so the browser created on it
+        stays usable across sync calls instead of being orphaned by a new loop.
+        """
+        with self._bg_lock:
+            if self._bg_loop is None or self._bg_loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="property-search-loop",
+                    daemon=True
+                )
+                thread.start()
+                self._bg_loop = loop
+            return self._bg_loop
 
     
     @staticmethod
@@ -601,100 +1075,53 @@ class PropertySearcher:
             return None, None
         
         # Clean and normalize the budget string
-        budget_lower = budget_str.lower().strip()
-        
-        # Remove common non-numeric phrases
-        budget_lower = re.sub(r'(around|approximately|about|give or take|roughly|maybe|nearly|almost)', '', budget_lower)
-        budget_lower = re.sub(r'\s+', ' ', budget_lower).strip()
-        
-        # Conversion factors
-        lakh = 100000
-        crore = 10000000
+        budget_lower = _BUDGET_FILLER_RE.sub('', budget_str.lower().strip())
         
-        # Extract numbers (handle commas and decimals properly)
-        # Remove commas from numbers first
-        budget_clean = re.sub(r'(\d),(\d)', r'\1\2', budget_lower)
+        # Remove thousands separators so "1,50,000" reads as one number
+        budget_clean = _BUDGET_THOUSANDS_RE.sub(r'\1\2', budget_lower)
         
-        # Find numbers (only valid decimal numbers, not just periods)
-        numbers = re.findall(r'\d+(?:\.\d+)?', budget_clean)
+        # Single tokenization pass: (value, unit multiplier or None)
+        tokens = []
+        for match in _BUDGET_TOKEN_RE.finditer(budget_clean):
+            value = float(match.group(1))
+            if value > 0:
+                unit = match.group(2)
+                tokens.append((value, _BUDGET_UNITS[unit] if unit else None))
         
-        if not numbers:
+        if not tokens:
             return None, None
         
-        # Filter out any invalid numbers (like just '.')
-        valid_numbers = []
-        for num in numbers:
-            try:
-                val = float(num)
-                if val > 0:
-                    valid_numbers.append(num)
-            except ValueError:
-                continue
-        
-        if not valid_numbers:
-            return None, None
-        
-        # Helper to determine multiplier based on context
-        def get_multiplier_for_value(value_str, budget_text, is_second=False):
-            """Determine the correct multiplier for a value based on surrounding text."""
-            val = float(value_str)
-            
-            # For ranges like "75 lakhs to 1 crore", split on common separators
-            separators = [' to ', ' - ', '-', ' and ', ',']
-            parts = [budget_text]
-            for sep in separators:
-                new_parts = []
-                for p in parts:
-                    new_parts.extend(p.split(sep))
-                parts = new_parts
-            
-            # Get the relevant part based on position
-            if is_second and len(parts) > 1:
-                context = parts[1] if len(parts) > 1 else parts[0]
-            else:
-                context = parts[0] if parts else budget_text
-            
-            context = context.lower().strip()
-            
-            # Look for unit in the relevant context
-            if 'crore' in context or ' cr' in context or context.endswith('cr'):
-                return crore
-            elif 'lakh' in context or 'lac' in context:
-                return lakh
-            elif 'k' in context:
-                return 1000
-            
-            # No explicit unit - use heuristics based on value magnitude
-            if val < 10:
+        def resolve_multiplier(value, multiplier):
+            """Fall back to magnitude heuristics when no unit was given."""
+            if multiplier is not None:
+                return multiplier
+            if value < 10:
                 # Very small number - likely crores
-                return crore
-            elif val < 500:
+                return _CRORE
+            elif value < 500:
                 # Reasonable range for lakhs
-                return lakh
-            else:
-                return 1
+                return _LAKH
+            return 1
         
-        try:
-            if len(valid_numbers) == 1:
-                # Single value - use as max, set min as 70% of max
-                multiplier = get_multiplier_for_value(valid_numbers[0], budget_clean, False)
-                max_val = int(float(valid_numbers[0]) * multiplier)
-                min_val = int(max_val * 0.7)
-                return min_val, max_val
-            else:
-                # Range - determine multiplier for each number independently
-                mult1 = get_multiplier_for_value(valid_numbers[0], budget_clean, False)
-                mult2 = get_multiplier_for_value(valid_numbers[1], budget_clean, True)
-                
-                min_val = int(float(valid_numbers[0]) * mult1)
-                max_val = int(float(valid_numbers[1]) * mult2)
-                
-                # Ensure min <= max
-                if min_val > max_val:
-                    min_val, max_val = max_val, min_val
-                return min_val, max_val
-        except (ValueError, IndexError):
-            return None, None
+        if len(tokens) == 1:
+            # Single value - use as max, set min as 70% of max
+            value, unit = tokens[0]
+            max_val = int(value * resolve_multiplier(value, unit))
+            min_val = int(max_val * 0.7)
+            return min_val, max_val
+        
+        # Range - "50 to 60 lakhs" shares the trailing unit
+        (first, unit1), (second, unit2) = tokens[0], tokens[1]
+        if unit1 is None and unit2 is not None:
+            unit1 = unit2
+        
+        min_val = int(first * resolve_multiplier(first, unit1))
+        max_val = int(second * resolve_multiplier(second, unit2))
+        
+        # Ensure min <= max
+        if min_val > max_val:
+            min_val, max_val = max_val, min_val
+        return min_val, max_val
     
     def is_available(self) -> bool:
         """Check if Playwright is available."""
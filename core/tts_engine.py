@@ -0,0 +1,206 @@
+# =============================================================================
+# RealtyAssistant AI Agent - Text-to-Speech Engine
+# =============================================================================
+"""
+Text-to-speech for voice responses using gTTS.
+Synthesized audio is cached by text hash in memory, so repeated phrases
+are served without another synthesis round-trip. Only prewarmed fixed
+phrases are also kept on disk; replies carrying caller details (names,
+phone numbers, emails) never leave memory.
+"""
+
+import io
+import os
+import asyncio
+import tempfile
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class TTSEngine:
+    """
+    gTTS wrapper with a content-addressed audio cache.
+
+    Features:
+    - In-memory LRU of recently spoken clips
+    - Bounded on-disk MP3 cache for prewarmed phrases, surviving restarts
+    - Prewarming for fixed phrases at startup
+    """
+
+    DEFAULT_CACHE_DIR = "data/tts_cache"
+    MAX_DISK_ITEMS = 512
+
+    def __init__(
+        self,
+        lang: str = "en",
+        tld: str = "co.in",
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        max_memory_items: int = 256
+    ):
+        """
+        Initialize the TTS engine.
+
+        Args:
+            lang: Speech language
+            tld: Google TLD selecting the accent ('co.in' for Indian English)
+            cache_dir: Directory for cached MP3 files (None disables disk cache)
+            max_memory_items: Number of clips kept in memory
+        """
+        self.lang = lang
+        self.tld = tld
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_memory_items = max_memory_items
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Keys of prewarmed phrases; the only clips written to disk
+        self._persistent_keys: set = set()
+
+    def _cache_key(self, text: str) -> str:
+        """Hash the text together with the voice settings."""
+        return hashlib.sha1(f"{self.lang}|{self.tld}|{text}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, audio: bytes):
+        """Store a clip in the in-memory LRU."""
+        with self._lock:
+            self._memory[key] = audio
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
+
+    def synthesize(self, text: str) -> Optional[bytes]:
+        """
+        Get MP3 audio for text, synthesizing only on a cache miss.
+
+        Args:
+            text: Text to speak
+
+        Returns:
+            MP3 bytes, or None if synthesis failed
+        """
+        if not text:
+            return None
+
+        key = self._cache_key(text)
+
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                return audio
+
+        path = (
+            self.cache_dir / f"{key}.mp3"
+            if self.cache_dir and key in self._persistent_keys else None
+        )
+        if path is not None and path.exists():
+            audio = path.read_bytes()
+            self._remember(key, audio)
+            return audio
+
+        try:
+            from gtts import gTTS
+
+            mp3_fp = io.BytesIO()
+            gTTS(text=text, lang=self.lang, tld=self.tld).write_to_fp(mp3_fp)
+            audio = mp3_fp.getvalue()
+        except ImportError:
+            logger.warning("gTTS not installed, skipping speech synthesis")
+            return None
+        except Exception as e:
+            logger.error(f"TTS Error: {e}")
+            return None
+
+        if path is not None:
+            self._write_disk(path, audio)
+
+        self._remember(key, audio)
+        return audio
+
+    def _write_disk(self, path: Path, audio: bytes):
+        """Write a clip atomically under a unique temp name, then cap the directory."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp file per writer, renamed into place, so concurrent
+            # writers of one key never interleave and readers never see a
+            # partial file
+            with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+                tmp.write(audio)
+            os.replace(tmp.name, path)
+        except OSError as e:
+            logger.debug(f"Could not write TTS cache file: {e}")
+            return
+        self._prune_disk()
+
+    def _prune_disk(self):
+        """
+        Keep the disk cache to prewarmed phrases and at most MAX_DISK_ITEMS.
+        
+        Clips for phrases that are no longer prewarmed (including ones
+        written by older versions that cached every reply) are removed.
+        """
+        if not self.cache_dir or not self.cache_dir.is_dir():
+            return
+        try:
+            kept = []
+            for file in self.cache_dir.glob("*.mp3"):
+                if file.stem in self._persistent_keys:
+                    kept.append(file)
+                else:
+                    file.unlink(missing_ok=True)
+            if len(kept) > self.MAX_DISK_ITEMS:
+                kept.sort(key=lambda f: f.stat().st_mtime)
+                for file in kept[:len(kept) - self.MAX_DISK_ITEMS]:
+                    file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not prune TTS cache: {e}")
+
+    async def synthesize_async(self, text: str) -> Optional[bytes]:
+        """Synthesize without blocking the event loop."""
+        return await asyncio.to_thread(self.synthesize, text)
+
+    async def prewarm(self, texts: Iterable[str]) -> int:
+        """
+        Synthesize fixed phrases ahead of time.
+
+        These phrases are the only ones cached on disk. Stops at the first
+        failure (e.g. offline) instead of retrying every phrase.
+
+        Args:
+            texts: Phrases to cache
+
+        Returns:
+            Number of phrases cached
+        """
+        phrases = [text for text in dict.fromkeys(texts) if text]
+        self._persistent_keys.update(self._cache_key(text) for text in phrases)
+        await asyncio.to_thread(self._prune_disk)
+
+        warmed = 0
+        for text in phrases:
+            if await self.synthesize_async(text) is None:
+                break
+            warmed += 1
+
+        logger.info(f"TTS cache prewarmed with {warmed} phrases")
+        return warmed
+
+
+# Singleton instance
+_tts_engine: Optional[TTSEngine] = None
+
+
+def get_tts_engine() -> TTSEngine:
+    """Get or create singleton TTSEngine instance."""
+    global _tts_engine
+
+    if _tts_engine is None:
+        _tts_engine = TTSEngine()
+
+    return _tts_engine
@@ -7,31 +7,369 @@ Uses fuzzy matching, synonym mapping, and LLM fallback for understanding.
 """
 
 import re
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List, Tuple
+import threading
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Deque, Callable, Awaitable, Sequence
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher, get_close_matches
+from enum import Enum
+from collections import deque, OrderedDict
 import unicodedata
 
+try:
+    from cydifflib import SequenceMatcher  # compiled drop-in for difflib
+except ImportError:
+    from difflib import SequenceMatcher
+
+try:
+    import ahocorasick  # pyahocorasick: C automaton for multi-phrase lookup
+except ImportError:
+    ahocorasick = None
+
+try:
+    from cachetools import TTLCache  # bounded, expiring session store
+except ImportError:
+    TTLCache = None
+
+try:
+    import numpy as np
+    from rapidfuzz import fuzz, process  # C++ edit-distance scoring
+except ImportError:
+    fuzz = process = None
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Budget extraction from normalized speech
+_BUDGET_AMOUNT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(lakhs?|lacs?|crores?|cr)\b')
+_BUDGET_UNIT_WORD_RE = re.compile(r'\b(?:(crores?|cr)|lakhs?|lacs?)\b')
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# Bedroom counts: "2 bhk" in speech, any leading count in LLM interpretations
+_BHK_NUM_RE = re.compile(r'(\d+)\s*(?:bhk|bk|bedroom|bed)')
+_BHK_LLM_RE = re.compile(r'(\d+)\s*(?:bhk|bk|bedroom)?', re.I)
+_BEDROOM_WORD_NUMS = {
+    'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5',
+    'ek': '1', 'do': '2', 'teen': '3', 'char': '4', 'paanch': '5',
+}
+
+# Spoken email dictation: "john dot doe at the rate gmail dot com"
+_EMAIL_SPOKEN_SYMBOLS = {
+    'at the rate': '@',
+    'at rate': '@',
+    'at': '@',
+    'dot': '.',
+    'period': '.',
+    'underscore': '_',
+}
+_EMAIL_SPOKEN_RE = re.compile(
+    ' (' + '|'.join(sorted(_EMAIL_SPOKEN_SYMBOLS, key=len, reverse=True)) + ') '
+)
+_EMAIL_SYMBOL_SPACE_RE = re.compile(r'\s*([@.])\s*')
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w.-]+\.\w+')
+
+# Greeting words, whole words only ("hi" but not "this" or "which")
+_GREETING_RE = re.compile(r'\b(?:hello|hi|hey|good\s+(?:morning|afternoon|evening))\b', re.IGNORECASE)
+
+# Words signalling interest; anchored at word start so "rent" matches
+# "renting" but not "currently"
+_INTEREST_RE = re.compile(
+    r'\b(?:looking|searching|want|need|buy|rent|property|flat|apartment|house|villa)',
+    re.IGNORECASE
+)
+
+# Questions about the listings after search results; word-start anchored
+# like _INTEREST_RE ("tell" but not "hotel")
+_INFO_REQUEST_RE = re.compile(r'\b(?:tell|more|about|details|price|cost|where|which)', re.IGNORECASE)
+
+# Property type hints when nothing else matched (substrings of normalized
+# speech, so "penthouse" still counts as a house)
+_APARTMENT_HINT_RE = re.compile(r'flat|apartment|building')
+_HOUSE_HINT_RE = re.compile(r'house|kothi|bungalow')
+
+# Lead-in phrases before a spoken name ("my name is John"); whole words
+# only, so names like "Itsuki" keep their first letters
+_NAME_PREFIX_RE = re.compile(r"^(?:my name is|this is|i am|i'm|call me|it's|its)\b\s*", re.IGNORECASE)
+
+# Text normalization
+_WORD_CHAR_RE = re.compile(r'[\w\s]')
+
+
+class _FoldTable(dict):
+    """
+    str.translate table that strips accents and punctuation per character.
+    
+    Each code point is folded on first sight - NFKD decomposition with
+    combining marks dropped, then anything that isn't a word character or
+    whitespace removed - and the result is remembered, so normalizing is a
+    single C-level translate() pass.
+    """
+    
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        if not char.isascii():
+            char = ''.join(
+                c for c in unicodedata.normalize('NFKD', char)
+                if not unicodedata.combining(c)
+            )
+        folded = ''.join(_WORD_CHAR_RE.findall(char)) or None
+        self[codepoint] = folded
+        return folded
+
+
+_FOLD_TABLE = _FoldTable()
+
+
+class _NormalizedText(str):
+    """A string that has already been through _normalize()."""
+    __slots__ = ()
+
+
+def _normalize(text: str) -> str:
+    """
+    Normalize text for matching - handle accents and cleaning.
+    
+    Normalizing is idempotent, so text that is already normalized is
+    returned as-is without touching the cache.
+    """
+    if type(text) is _NormalizedText:
+        return text
+    return _normalize_cached(text)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(text: str) -> _NormalizedText:
+    """Cached worker for _normalize()."""
+    if not text:
+        return _NormalizedText("")
+    
+    # Lowercase, then drop accents/diacritics and punctuation in one pass
+    # ("don't" -> "dont", not "don t")
+    text = text.lower().translate(_FOLD_TABLE)
+    
+    # Normalize whitespace
+    return _NormalizedText(' '.join(text.split()))
+
+
+@lru_cache(maxsize=256)
+def _option_index(options: Tuple[str, ...]) -> Tuple[Dict[str, str], Tuple[str, ...]]:
+    """
+    Pre-normalize an option list once.
+    
+    Returns:
+        Tuple of (normalized -> first matching option, normalized options)
+    """
+    exact: Dict[str, str] = {}
+    normalized = tuple(_normalize(opt) for opt in options)
+    for opt, opt_norm in zip(options, normalized):
+        exact.setdefault(opt_norm, opt)
+    return exact, normalized
+
+
+def _ratio_bound(a: str, b: str) -> float:
+    """
+    Upper bound on similarity ratio from string lengths alone.
+    
+    At most min(len) characters can match, so similarity is capped at
+    2*min/(len_a+len_b) - a pair that can't reach the cutoff is skipped
+    without any character comparison.
+    """
+    total = len(a) + len(b)
+    return 2.0 * min(len(a), len(b)) / total if total else 1.0
+
+
+def _gated_ratio(matcher: SequenceMatcher, floor: float) -> float:
+    """
+    difflib ratio() for the matcher's current pair, or 0.0 if it can't beat floor.
+    
+    quick_ratio() is a character-multiset upper bound on ratio(), so pairs
+    that fail it skip the longest-matching-block search entirely.
+    """
+    if matcher.a == matcher.b:
+        return 1.0
+    if matcher.quick_ratio() < floor:
+        return 0.0
+    return matcher.ratio()
+
+
+class _PhraseIndex:
+    """
+    One index of every known phrase across all matching domains.
+    
+    scan() walks normalized text once and returns the longest whole-word
+    phrase found for each domain, so "greater noida" beats "noida" and
+    "studio apartment" beats "apartment". With pyahocorasick installed the
+    walk is a single C-level automaton pass; otherwise word n-grams are
+    looked up directly. Scans are cached, so the several matchers that run
+    on one utterance share a single pass.
+    """
+    
+    def __init__(self, domains: Dict[str, Dict[str, Any]]):
+        # phrase -> [(domain, value), ...]; a phrase may belong to several domains
+        self._entries: Dict[str, List[Tuple[str, Any]]] = {}
+        for domain, phrases in domains.items():
+            for phrase, value in phrases.items():
+                if phrase:
+                    self._entries.setdefault(phrase, []).append((domain, value))
+        
+        self._max_words = max((phrase.count(' ') + 1 for phrase in self._entries), default=0)
+        self._automaton = None
+        
+        if ahocorasick is not None and self._entries:
+            automaton = ahocorasick.Automaton()
+            for phrase in self._entries:
+                automaton.add_word(phrase, phrase)
+            automaton.make_automaton()
+            self._automaton = automaton
+        
+        self.scan = lru_cache(maxsize=1024)(self._scan)
+    
+    def _iter_phrases(self, text: str):
+        """Yield every known phrase occurring as whole words in text."""
+        if self._automaton is not None:
+            last = len(text) - 1
+            for end, phrase in self._automaton.iter(text):
+                start = end - len(phrase) + 1
+                if (start == 0 or text[start - 1] == ' ') and (end == last or text[end + 1] == ' '):
+                    yield phrase
+            return
+        
+        words = text.split(' ')
+        for i in range(len(words)):
+            for n in range(1, min(self._max_words, len(words) - i) + 1):
+                phrase = ' '.join(words[i:i + n])
+                if phrase in self._entries:
+                    yield phrase
+    
+    def exact(self, text: str, domain: str) -> Optional[Tuple[str, Any]]:
+        """(phrase, value) if the whole text is a phrase of domain, else None."""
+        for entry_domain, value in self._entries.get(text, ()):
+            if entry_domain == domain:
+                return text, value
+        return None
+    
+    def _scan(self, text: str) -> Dict[str, Tuple[str, Any]]:
+        """Map each domain to its longest (phrase, value) hit in text."""
+        hits: Dict[str, Tuple[str, Any]] = {}
+        if not text:
+            return hits
+        
+        for phrase in self._iter_phrases(text):
+            for domain, value in self._entries[phrase]:
+                current = hits.get(domain)
+                if current is None or len(phrase) > len(current[0]):
+                    hits[domain] = (phrase, value)
+        return hits
+
+
+@lru_cache(maxsize=512)
+def _initial_greeting(lead_name: str) -> str:
+    """Opening line for a call; lead names recur, so it is cached per name."""
+    return f"Hello! This is RealtyAssistant calling about your property enquiry. Am I speaking with {lead_name}?"
+
+
+# Fixed LLM instructions, sent as the system prompt ahead of the per-turn
+# details so the backend can reuse the evaluated prefix across calls
+_ENHANCE_SYSTEM_PROMPT = """You are a friendly real estate assistant on a phone call. 
+Make this response sound more natural and human-like for a voice call.
+Keep it short (1-2 sentences max) and conversational."""
+
+_INTERPRET_SYSTEM_PROMPT = """You are helping interpret a voice transcription from a phone call.
+The transcription might have accents or mispronunciations.
+
+What did the user most likely mean? Give just the interpreted value, nothing else.
+If you can't determine, say "UNCLEAR".
+
+Examples:
+- "noyda" for city → Noida
+- "too bhk" for bedrooms → 2 BHK
+- "yess please" for yes/no → yes"""
+
+_EXTRACT_SYSTEM_PROMPT = """Extract property search requirements from this customer statement.
+Return ONLY a JSON object with these fields (use null for missing info):
+
+Fields to extract:
+- location: City name in India (e.g., Noida, Mumbai, Delhi, Bangalore)
+- property_category: "Residential" or "Commercial"  
+- property_type: Apartment/Flat, Villa/House, Plot, Office, Shop, etc.
+- bedroom: Number of bedrooms (e.g., "2 BHK", "3 BHK")
+- budget: Budget amount (e.g., "50 Lakhs", "1 Crore", "80 Lakhs to 1 Crore")
+- name: Customer's name if they mentioned it
+- timeline: When they want to buy (e.g., "immediately", "3 months", "6 months")
+- purpose: "investment", "self-use", "rental", etc."""
+
+
+# Conversation turns kept per voice session
+MAX_HISTORY_TURNS = 40
+
+# Sentinel distinguishing a cache miss from a cached None
+_CACHE_MISS = object()
+
+
+class _LRUSessions(OrderedDict):
+    """Size-capped LRU store used when cachetools is unavailable."""
+    
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        # Evict the least recently stored sessions past the cap
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class VoiceStage(str, Enum):
+    """Stages of a voice call."""
+    GREETING = "greeting"
+    INTEREST_CHECK = "interest_check"
+    LOCATION = "location"
+    PROPERTY_CATEGORY = "property_category"
+    PROPERTY_TYPE = "property_type"
+    BEDROOM = "bedroom"
+    VERIFY_REQUIREMENTS = "verify_requirements"
+    SEARCH_COMPLETE = "search_complete"
+    ASK_NAME = "ask_name"
+    BUDGET = "budget"
+    PHONE_CONFIRM = "phone_confirm"
+    COMPLETE = "complete"
+    THANK_YOU = "thank_you"
+    ERROR = "error"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+# Stages where a long, detailed answer may fill several slots at once
+_RICH_INPUT_STAGES = frozenset({
+    VoiceStage.INTEREST_CHECK, VoiceStage.LOCATION, VoiceStage.PROPERTY_CATEGORY,
+    VoiceStage.PROPERTY_TYPE, VoiceStage.BEDROOM,
+})
+
+
+@dataclass(slots=True)
 class VoiceSession:
     """Voice call session state."""
     session_id: str
-    current_stage: str = "greeting"
+    current_stage: VoiceStage = VoiceStage.GREETING
     collected_data: Dict[str, Any] = field(default_factory=dict)
-    conversation_history: List[Dict[str, str]] = field(default_factory=list)
+    # Bounded: only recent turns are ever used for LLM context
+    conversation_history: Deque[Dict[str, str]] = field(
+        default_factory=lambda: deque(maxlen=MAX_HISTORY_TURNS)
+    )
     retry_count: int = 0
     max_retries: int = 2
 
 
-@dataclass 
+# Frozen: ERROR_RESPONSE is a shared instance returned to every caller
+@dataclass(slots=True, frozen=True)
 class VoiceResponse:
     """Response to send back to voice caller."""
     message: str
-    next_stage: str
+    next_stage: VoiceStage
     options: Optional[List[str]] = None
     is_complete: bool = False
     collected_data: Optional[Dict[str, Any]] = None
@@ -93,6 +431,12 @@ class VoiceHandler:
         'residential studio': ['studio', 'studio apartment', 'bachelor pad', 'single room'],
     }
     
+    # Property types offered per category
+    PROPERTY_TYPES = {
+        'residential': ('Apartments', 'Villas', 'Residential Plots', 'Independent Floor', 'Residential Studio'),
+        'commercial': ('Office Space', 'Shop', 'Commercial Plots', 'Showrooms', 'High Street Retail'),
+    }
+    
     # Bedroom variations - handles accent issues
     BEDROOM_VARIATIONS = {
         '1 bhk': ['1 bhk', 'one bhk', '1bhk', 'one bedroom', '1 bedroom', 'single bhk', 'ek bhk', 'one bk', '1 bk'],
@@ -111,69 +455,109 @@ class VoiceHandler:
                'not interested', 'nahi', 'na', 'mat karo', 'baad mein']
     }
     
+    # Fixed lines returned verbatim by the stage handlers; listed once so
+    # the same strings are what static_messages() prewarms in the TTS cache
+    FIXED_REPLIES = {
+        'ask_name_again': "I didn't catch that. Could you please tell me your name?",
+        'ask_city': "Great! Which city are you looking for property in?",
+        'intro_ask_city': "Great! I'm from RealtyAssistant, and I'd love to help you find the perfect property. Which city are you looking in?",
+        'interested_ask_city': "Great! Which city are you interested in?",
+        'interest_recheck': "I just wanted to check - are you currently looking for a property to buy or rent?",
+        'city_retry': "I didn't quite catch that. Could you please tell me the city name again? For example, Noida, Mumbai, Delhi, or Bangalore?",
+        'commercial_type': "Commercial property it is! What type are you looking for? Office space, Shop, or Showroom?",
+        'residential_type': "Perfect! What type of residential property? Apartment, Villa, or Plot?",
+        'assume_residential': "I'll assume Residential. What type of property? Apartment, Villa, or Plot?",
+        'category_retry': "Would you like a Residential property like a flat or house? Or a Commercial property like a shop or office?",
+        'requirements_retry': "No problem! Please tell me what you're looking for - the city, property type, bedrooms, budget - anything you'd like.",
+        'callback_ask_name': "Wonderful! Before I connect you with our expert, may I know your good name?",
+        'callback_declined': "No problem at all! Thank you for your time. If you ever need help finding a property, feel free to call RealtyAssistant. Have a wonderful day!",
+        'callback_arranged': "I'll arrange a callback for you. May I have your name please?",
+        'name_retry': "I didn't catch your name. Could you please tell me your name?",
+    }
+    
+    # Fixed responses, built once and shared (no per-session data)
+    THANK_YOU_MESSAGE = "Thank you for your time! Feel free to call us back anytime. Goodbye!"
+    ERROR_RESPONSE = VoiceResponse(
+        message="I apologize, I'm having trouble understanding. Let me transfer you to a human agent. Please hold.",
+        next_stage=VoiceStage.ERROR,
+        is_complete=True,
+        confidence=0.0
+    )
+    
+    # Session store bounds
+    MAX_SESSIONS = 10_000
+    SESSION_TTL_SECONDS = 1800
+    
+    # LLM interpretations of unclear answers, shared across sessions
+    INTERPRET_CACHE_SIZE = 1024
+    INTERPRET_CACHE_TTL_SECONDS = 3600
+    
+    # Turns processed at once across all sessions (bounds LLM/search fan-out)
+    MAX_CONCURRENT_TURNS = 64
+    
     # Conversation flow - mirrors chat widget with natural intro
     CONVERSATION_FLOW = {
-        'greeting': {
+        VoiceStage.GREETING: {
             'question': "Hello! This is RealtyAssistant calling. Am I speaking with {name}?",
             'field': 'name_confirmed',
-            'next': 'interest_check'
+            'next': VoiceStage.INTEREST_CHECK
         },
-        'interest_check': {
+        VoiceStage.INTEREST_CHECK: {
             'question': "Are you currently interested in purchasing or renting a property?",
             'field': 'interested',
-            'next': 'location'
+            'next': VoiceStage.LOCATION
         },
-        'location': {
+        VoiceStage.LOCATION: {
             'question': "Great! Which city are you looking for property in?",
             'field': 'location',
-            'next': 'property_category'
+            'next': VoiceStage.PROPERTY_CATEGORY
         },
-        'property_category': {
+        VoiceStage.PROPERTY_CATEGORY: {
             'question': "Got it! Are you looking for a Residential or Commercial property?",
             'field': 'property_category',
-            'next': 'property_type'
+            'next': VoiceStage.PROPERTY_TYPE
         },
-        'property_type': {
+        VoiceStage.PROPERTY_TYPE: {
             'question': None,  # Dynamic based on category
             'field': 'property_type',
-            'next': 'bedroom'
+            'next': VoiceStage.BEDROOM
         },
-        'bedroom': {
+        VoiceStage.BEDROOM: {
             'question': "How many bedrooms do you need? 1 BHK, 2 BHK, 3 BHK, or 4 BHK?",
             'field': 'bedroom',
-            'next': 'search_complete'
+            'next': VoiceStage.SEARCH_COMPLETE
         },
-        'verify_requirements': {
+        VoiceStage.VERIFY_REQUIREMENTS: {
             'question': "Did I get your requirements right?",
             'field': 'verified',
-            'next': 'search_complete'
+            'next': VoiceStage.SEARCH_COMPLETE
         },
-        'search_complete': {
+        VoiceStage.SEARCH_COMPLETE: {
             'question': "Excellent! I'm searching for matching properties now. Would you like our property expert to call you with personalized recommendations?",
             'field': 'consent',
             'next': None  # Dynamic
         },
-        'ask_name': {
+        VoiceStage.ASK_NAME: {
             'question': "By the way, may I know your good name so our expert knows who to ask for?",
             'field': 'name',
-            'next': 'budget'
+            'next': VoiceStage.BUDGET
         },
-        'budget': {
+        VoiceStage.BUDGET: {
             'question': "What's your budget range for this property?",
             'field': 'budget',
-            'next': 'phone_confirm'
+            'next': VoiceStage.PHONE_CONFIRM
         },
-        'phone_confirm': {
+        VoiceStage.PHONE_CONFIRM: {
             'question': "I'll have an expert call you at this number. Can you also share your email for property alerts?",
             'field': 'email',
-            'next': 'complete'
+            'next': VoiceStage.COMPLETE
         },
-        'complete': {
+        VoiceStage.COMPLETE: {
             'question': "Thank you! Our property expert will contact you shortly with matching properties in {location}. Have a wonderful day!",
             'field': None,
             'next': None
         },
-        'thank_you': {
+        VoiceStage.THANK_YOU: {
             'question': "No problem! Thank you for your interest. Feel free to call us anytime. Have a great day!",
             'field': None,
             'next': None
@@ -184,73 +568,160 @@ class VoiceHandler:
         """Initialize voice handler with engines."""
         self.llm_engine = llm_engine
         self.property_searcher = property_searcher
-        self.sessions: Dict[str, VoiceSession] = {}
-        
-        # Build reverse lookup for faster matching
-        self._build_reverse_lookups()
+        # Idle sessions expire and the store is capped, so abandoned calls
+        # don't accumulate for the life of the process (without cachetools,
+        # the store is an LRU with the same cap but no expiry)
+        if TTLCache is not None:
+            self.sessions: Dict[str, VoiceSession] = TTLCache(
+                maxsize=self.MAX_SESSIONS, ttl=self.SESSION_TTL_SECONDS
+            )
+        else:
+            self.sessions = _LRUSessions(self.MAX_SESSIONS)
+        # (expected type, normalized speech) -> interpretation, or None when
+        # the LLM answered UNCLEAR; the same ASR garble recurs across callers
+        if TTLCache is not None:
+            self._interpret_cache: Dict[Tuple[str, str], Optional[str]] = TTLCache(
+                maxsize=self.INTERPRET_CACHE_SIZE, ttl=self.INTERPRET_CACHE_TTL_SECONDS
+            )
+        else:
+            self._interpret_cache = _LRUSessions(self.INTERPRET_CACHE_SIZE)
+        self._interpret_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        # Same-session turns run one at a time; different sessions run concurrently
+        self._session_locks: Dict[str, asyncio.Lock] = {}
+        self._turn_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TURNS)
+        # Stage -> handler; all handlers are coroutines taking (session, speech)
+        self._stage_handlers: Dict[VoiceStage, Callable[[VoiceSession, str], Awaitable[VoiceResponse]]] = {
+            VoiceStage.GREETING: self._handle_greeting,
+            VoiceStage.INTEREST_CHECK: self._handle_interest_check,
+            VoiceStage.LOCATION: self._handle_location,
+            VoiceStage.PROPERTY_CATEGORY: self._handle_category,
+            VoiceStage.PROPERTY_TYPE: self._handle_property_type,
+            VoiceStage.BEDROOM: self._handle_bedroom,
+            VoiceStage.VERIFY_REQUIREMENTS: self._handle_verify_requirements,
+            VoiceStage.SEARCH_COMPLETE: self._handle_search_complete,
+            VoiceStage.ASK_NAME: self._handle_ask_name,
+            VoiceStage.BUDGET: self._handle_budget,
+            VoiceStage.PHONE_CONFIRM: self._handle_email,
+            VoiceStage.COMPLETE: self._handle_complete,
+            VoiceStage.THANK_YOU: self._handle_thank_you,
+        }
     
-    def _build_reverse_lookups(self):
-        """Build reverse mapping for fast fuzzy matching."""
-        self.city_lookup = {}
-        for canonical, variations in self.CITY_VARIATIONS.items():
-            for var in variations:
-                self.city_lookup[var.lower()] = canonical
+    def __init_subclass__(cls, **kwargs):
+        """Rebuild lookups for subclasses that override the variation tables."""
+        super().__init_subclass__(**kwargs)
+        cls._build_reverse_lookups()
+    
+    @classmethod
+    def _build_reverse_lookups(cls):
+        """
+        Build reverse mappings and matchers for fast fuzzy matching.
         
-        self.bedroom_lookup = {}
-        for canonical, variations in self.BEDROOM_VARIATIONS.items():
+        The variation tables are class constants, so this runs once per class
+        at import time rather than for every handler instance.
+        """
+        cls.city_lookup = {}
+        for canonical, variations in cls.CITY_VARIATIONS.items():
             for var in variations:
-                self.bedroom_lookup[var.lower()] = canonical
+                cls.city_lookup[var.lower()] = canonical
         
-        self.category_lookup = {}
-        for canonical, variations in self.CATEGORY_VARIATIONS.items():
+        cls.bedroom_lookup = {}
+        for canonical, variations in cls.BEDROOM_VARIATIONS.items():
             for var in variations:
-                self.category_lookup[var.lower()] = canonical
-    
-    def _normalize_text(self, text: str) -> str:
-        """Normalize text for matching - handle accents and cleaning."""
-        if not text:
-            return ""
+                cls.bedroom_lookup[var.lower()] = canonical
         
-        # Convert to lowercase
-        text = text.lower().strip()
+        cls.category_lookup = {}
+        for canonical, variations in cls.CATEGORY_VARIATIONS.items():
+            for var in variations:
+                cls.category_lookup[var.lower()] = canonical
         
-        # Remove accents/diacritics
-        text = unicodedata.normalize('NFKD', text)
-        text = ''.join(c for c in text if not unicodedata.combining(c))
+        # Flat parallel arrays for the fuzzy fallback: normalized variation
+        # and its canonical city at the same index
+        cls._city_vars_norm = []
+        cls._city_vars_canon = []
+        for canonical, variations in cls.CITY_VARIATIONS.items():
+            for var in variations:
+                cls._city_vars_norm.append(_normalize(var))
+                cls._city_vars_canon.append(canonical)
         
-        # Remove punctuation except spaces
-        text = re.sub(r'[^\w\s]', '', text)
+        # Normalized once here, matchers only normalize the utterance
+        cls._property_types_norm = {
+            kind: tuple((ptype, _normalize(ptype)) for ptype in types)
+            for kind, types in cls.PROPERTY_TYPES.items()
+        }
+        cls._bedroom_options = tuple(cls.BEDROOM_VARIATIONS)
         
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Cities and Mumbai areas share a domain, value is (canonical, is_mumbai_area)
+        city_phrases = {
+            _normalize(var): (canonical, False)
+            for var, canonical in cls.city_lookup.items()
+        }
+        for area in cls.MUMBAI_AREAS:
+            city_phrases[_normalize(area)] = ('mumbai', True)
+        
+        cls._phrase_index = _PhraseIndex({
+            'city': city_phrases,
+            'bedroom': {_normalize(var): canonical for var, canonical in cls.bedroom_lookup.items()},
+            'category': {_normalize(var): canonical for var, canonical in cls.category_lookup.items()},
+            'residential_type': {
+                _normalize(var): canonical
+                for canonical, variations in cls.PROPERTY_TYPE_RESIDENTIAL.items()
+                for var in variations
+            },
+            'consent_yes': {_normalize(var): True for var in cls.CONSENT_VARIATIONS['yes']},
+            'consent_no': {_normalize(var): False for var in cls.CONSENT_VARIATIONS['no']},
+        })
         
-        return text
+        # Cached results are keyed by class; drop any built from old tables
+        for matcher in (cls._match_city_norm, cls._match_bedroom_norm,
+                        cls._match_category_norm, cls._match_consent_norm):
+            matcher.cache_clear()
+    
+    # Cached: the same option strings are normalized on every turn
+    _normalize_text = staticmethod(_normalize)
     
-    def _fuzzy_match(self, text: str, options: List[str], threshold: float = 0.6) -> Optional[str]:
+    @classmethod
+    def _fuzzy_match(cls, text: str, options: Sequence[str], threshold: float = 0.6) -> Optional[str]:
         """Fuzzy match text against options with configurable threshold."""
-        text = self._normalize_text(text)
+        text = cls._normalize_text(text)
         
         if not text:
             return None
         
-        # Direct match first
-        for opt in options:
-            if self._normalize_text(opt) == text:
-                return opt
+        options = tuple(options)
+        exact, options_norm = _option_index(options)
+        
+        # Direct match first (distance 0) - dict hit, no scoring at all
+        opt = exact.get(text)
+        if opt is not None:
+            return opt
         
         # Substring match
-        for opt in options:
-            opt_norm = self._normalize_text(opt)
+        for opt, opt_norm in zip(options, options_norm):
             if text in opt_norm or opt_norm in text:
                 return opt
         
-        # Fuzzy match using SequenceMatcher
+        # Fuzzy match - RapidFuzz turns the threshold into a distance bound
+        # and abandons each comparison as soon as it can't be reached
+        if process is not None:
+            best = process.extractOne(
+                text,
+                options_norm,
+                scorer=fuzz.ratio,
+                score_cutoff=threshold * 100
+            )
+            return options[best[2]] if best else None
+        
         best_match = None
         best_ratio = 0
-        
-        for opt in options:
-            opt_norm = self._normalize_text(opt)
-            ratio = SequenceMatcher(None, text, opt_norm).ratio()
+        # One matcher for the utterance, re-pointed at each option
+        matcher = SequenceMatcher(None, text)
+        
+        for opt, opt_norm in zip(options, options_norm):
+            bound = _ratio_bound(text, opt_norm)
+            if bound < threshold or bound <= best_ratio:
+                continue
+            matcher.set_seq2(opt_norm)
+            ratio = _gated_ratio(matcher, max(best_ratio, threshold))
             if ratio > best_ratio and ratio >= threshold:
                 best_ratio = ratio
                 best_match = opt
@@ -259,47 +730,67 @@ class VoiceHandler:
     
     def _match_city(self, speech: str) -> Tuple[Optional[str], float]:
         """Match spoken city name with confidence score."""
-        speech_norm = self._normalize_text(speech)
-        
+        return self._match_city_norm(self._normalize_text(speech))
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _match_city_norm(cls, speech_norm: str) -> Tuple[Optional[str], float]:
+        """Cached match on normalized speech; the lookup tables are class constants."""
         if not speech_norm:
             return None, 0.0
         
-        # Check Mumbai areas first (map to Mumbai)
-        for area in self.MUMBAI_AREAS:
-            if area in speech_norm:
-                logger.info(f"Matched Mumbai area: {area}")
+        # Direct lookup of city variations and Mumbai areas (longest match
+        # wins); an utterance that is itself a variation skips the scan
+        hit = (cls._phrase_index.exact(speech_norm, 'city')
+               or cls._phrase_index.scan(speech_norm).get('city'))
+        if hit:
+            phrase, (canonical, is_mumbai_area) = hit
+            if is_mumbai_area:
+                logger.info(f"Matched Mumbai area: {phrase}")
                 return 'mumbai', 0.9
+            return canonical.title(), 0.95
         
-        # Direct lookup in built mapping
-        for var, canonical in self.city_lookup.items():
-            if var in speech_norm:
-                return canonical.title(), 0.95
-        
-        # Fuzzy match against all cities
-        all_cities = list(self.CITY_VARIATIONS.keys())
+        # Fuzzy match against all city variations
         best_match = None
         best_score = 0.0
+        words = speech_norm.split()
+        
+        if process is not None:
+            # Score the whole utterance and each word against every variation
+            # in one similarity matrix (queries x variations); cells below the
+            # threshold come back as 0
+            scores = process.cdist(
+                [speech_norm, *words],
+                cls._city_vars_norm,
+                scorer=fuzz.ratio,
+                score_cutoff=60,
+                dtype=np.float64
+            )
+            best_index = int(scores.argmax())
+            best_score = float(scores.flat[best_index]) / 100.0
+            
+            if best_score >= 0.6:
+                city = cls._city_vars_canon[best_index % scores.shape[1]]
+                return city.title(), best_score
+            return None, 0.0
         
-        for city in all_cities:
-            for var in self.CITY_VARIATIONS[city]:
-                var_norm = self._normalize_text(var)
-                
-                # Check if variation appears in speech
-                if var_norm in speech_norm:
-                    return city.title(), 0.95
-                
-                # Calculate similarity
-                ratio = SequenceMatcher(None, var_norm, speech_norm).ratio()
-                
-                # Also check word-level similarity
-                words = speech_norm.split()
-                for word in words:
-                    word_ratio = SequenceMatcher(None, var_norm, word).ratio()
-                    ratio = max(ratio, word_ratio)
-                
-                if ratio > best_score:
-                    best_score = ratio
-                    best_match = city
+        # One matcher per query: set_seq2 indexes the query's characters once
+        # and set_seq1 swaps in each variation without rebuilding that index
+        matchers = [SequenceMatcher(None, '', query) for query in (speech_norm, *words)]
+        
+        for var_norm, city in zip(cls._city_vars_norm, cls._city_vars_canon):
+            # Similarity against the whole utterance and each word, skipping
+            # pairs whose lengths alone rule out beating the current best
+            ratio = 0.0
+            for matcher in matchers:
+                floor = max(ratio, best_score)
+                if _ratio_bound(var_norm, matcher.b) > floor:
+                    matcher.set_seq1(var_norm)
+                    ratio = max(ratio, _gated_ratio(matcher, floor))
+            
+            if ratio > best_score:
+                best_score = ratio
+                best_match = city
         
         if best_score >= 0.6:
             return best_match.title(), best_score
@@ -308,31 +799,31 @@ class VoiceHandler:
     
     def _match_bedroom(self, speech: str) -> Tuple[Optional[str], float]:
         """Match spoken bedroom requirement."""
-        speech_norm = self._normalize_text(speech)
-        
+        return self._match_bedroom_norm(self._normalize_text(speech))
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _match_bedroom_norm(cls, speech_norm: str) -> Tuple[Optional[str], float]:
+        """Cached match on normalized speech; the lookup tables are class constants."""
         # Check for numeric patterns first
-        bhk_pattern = r'(\d+)\s*(?:bhk|bk|bedroom|bed)'
-        match = re.search(bhk_pattern, speech_norm)
+        match = _BHK_NUM_RE.search(speech_norm)
         if match:
             num = int(match.group(1))
             if 1 <= num <= 5:
                 return f'{num} BHK', 0.95
         
         # Check for word numbers
-        word_nums = {'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5',
-                     'ek': '1', 'do': '2', 'teen': '3', 'char': '4', 'paanch': '5'}
-        for word, num in word_nums.items():
+        for word, num in _BEDROOM_WORD_NUMS.items():
             if word in speech_norm and ('bhk' in speech_norm or 'bedroom' in speech_norm or 'bk' in speech_norm):
                 return f'{num} BHK', 0.9
         
         # Direct lookup
-        for var, canonical in self.bedroom_lookup.items():
-            if var in speech_norm:
-                return canonical.upper().replace(' BHK', ' BHK'), 0.9
+        hit = cls._phrase_index.scan(speech_norm).get('bedroom')
+        if hit:
+            return hit[1].upper(), 0.9
         
         # Fuzzy match
-        all_bedrooms = list(self.BEDROOM_VARIATIONS.keys())
-        match = self._fuzzy_match(speech, all_bedrooms, threshold=0.5)
+        match = cls._fuzzy_match(speech_norm, cls._bedroom_options, threshold=0.5)
         if match:
             return match.upper().replace(' BHK', ' BHK'), 0.7
         
@@ -340,41 +831,50 @@ class VoiceHandler:
     
     def _match_category(self, speech: str) -> Tuple[Optional[str], float]:
         """Match property category (residential/commercial)."""
-        speech_norm = self._normalize_text(speech)
-        
+        return self._match_category_norm(self._normalize_text(speech))
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _match_category_norm(cls, speech_norm: str) -> Tuple[Optional[str], float]:
+        """Cached match on normalized speech; the lookup tables are class constants."""
         # Direct lookup
-        for var, canonical in self.category_lookup.items():
-            if var in speech_norm:
-                return f'{canonical.title()} Properties', 0.95
+        hit = (cls._phrase_index.exact(speech_norm, 'category')
+               or cls._phrase_index.scan(speech_norm).get('category'))
+        if hit:
+            return f'{hit[1].title()} Properties', 0.95
         
         # Fuzzy match
-        if self._fuzzy_match(speech, self.CATEGORY_VARIATIONS['residential'], threshold=0.6):
+        if cls._fuzzy_match(speech_norm, cls.CATEGORY_VARIATIONS['residential'], threshold=0.6):
             return 'Residential Properties', 0.8
-        if self._fuzzy_match(speech, self.CATEGORY_VARIATIONS['commercial'], threshold=0.6):
+        if cls._fuzzy_match(speech_norm, cls.CATEGORY_VARIATIONS['commercial'], threshold=0.6):
             return 'Commercial Properties', 0.8
         
         return None, 0.0
     
     def _match_consent(self, speech: str) -> Tuple[Optional[bool], float]:
         """Match consent response (yes/no)."""
-        speech_norm = self._normalize_text(speech)
+        return self._match_consent_norm(self._normalize_text(speech))
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _match_consent_norm(cls, speech_norm: str) -> Tuple[Optional[bool], float]:
+        """Cached match on normalized speech; the lookup tables are class constants."""
+        # Check for no variations first - "no, please don't call" carries a
+        # yes word ("please") but is a refusal
+        hits = cls._phrase_index.scan(speech_norm)
+        if 'consent_no' in hits:
+            return False, 0.95
         
         # Check for yes variations
-        for var in self.CONSENT_VARIATIONS['yes']:
-            if var in speech_norm:
-                return True, 0.95
-        
-        # Check for no variations
-        for var in self.CONSENT_VARIATIONS['no']:
-            if var in speech_norm:
-                return False, 0.95
+        if 'consent_yes' in hits:
+            return True, 0.95
         
         # Fuzzy match
-        yes_match = self._fuzzy_match(speech, self.CONSENT_VARIATIONS['yes'], threshold=0.6)
+        yes_match = cls._fuzzy_match(speech_norm, cls.CONSENT_VARIATIONS['yes'], threshold=0.6)
         if yes_match:
             return True, 0.7
         
-        no_match = self._fuzzy_match(speech, self.CONSENT_VARIATIONS['no'], threshold=0.6)
+        no_match = cls._fuzzy_match(speech_norm, cls.CONSENT_VARIATIONS['no'], threshold=0.6)
         if no_match:
             return False, 0.7
         
@@ -384,32 +884,29 @@ class VoiceHandler:
         """Match property type based on category."""
         speech_norm = self._normalize_text(speech)
         
-        if 'commercial' in category.lower():
-            types = ['Office Space', 'Shop', 'Commercial Plots', 'Showrooms', 'High Street Retail']
-        else:
-            types = ['Apartments', 'Villas', 'Residential Plots', 'Independent Floor', 'Residential Studio']
+        kind = 'commercial' if 'commercial' in category.lower() else 'residential'
+        types = self.PROPERTY_TYPES[kind]
         
         # Direct match
-        for ptype in types:
-            if self._normalize_text(ptype) in speech_norm:
+        for ptype, ptype_norm in self._property_types_norm[kind]:
+            if ptype_norm in speech_norm:
                 return ptype, 0.95
         
-        # Check variations for residential
+        # Check variations for residential (longest variation wins)
         if 'residential' in category.lower():
-            for canonical, variations in self.PROPERTY_TYPE_RESIDENTIAL.items():
-                for var in variations:
-                    if var in speech_norm:
-                        return canonical.title(), 0.9
+            hit = self._phrase_index.scan(speech_norm).get('residential_type')
+            if hit:
+                return hit[1].title(), 0.9
         
         # Fuzzy match
-        match = self._fuzzy_match(speech, types, threshold=0.5)
+        match = self._fuzzy_match(speech_norm, types, threshold=0.5)
         if match:
             return match, 0.7
         
         # Default based on common keywords
-        if any(kw in speech_norm for kw in ['flat', 'apartment', 'building']):
+        if _APARTMENT_HINT_RE.search(speech_norm):
             return 'Apartments', 0.6
-        if any(kw in speech_norm for kw in ['house', 'kothi', 'bungalow']):
+        if _HOUSE_HINT_RE.search(speech_norm):
             return 'Villas', 0.6
         
         return 'Apartments', 0.5  # Default to apartments
@@ -418,33 +915,21 @@ class VoiceHandler:
         """Extract budget from speech."""
         speech_norm = self._normalize_text(speech)
         
-        # Look for patterns like "50 lakhs", "1 crore", "1.5 cr"
-        patterns = [
-            r'(\d+(?:\.\d+)?)\s*(?:lakh|lac|lacs|lakhs)',
-            r'(\d+(?:\.\d+)?)\s*(?:crore|cr|crores)',
-            r'around\s*(\d+(?:\.\d+)?)\s*(?:lakh|lac|crore|cr)',
-            r'budget\s*(?:is|of)?\s*(\d+(?:\.\d+)?)\s*(?:lakh|lac|crore|cr)?',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, speech_norm)
-            if match:
-                value = match.group(1)
-                if 'crore' in speech_norm or ' cr' in speech_norm:
-                    return f"{value} Crore"
-                else:
-                    return f"{value} Lakhs"
-        
-        # Extract any mentioned number with lakhs/crore
-        if 'crore' in speech_norm or ' cr ' in speech_norm:
-            nums = re.findall(r'(\d+(?:\.\d+)?)', speech_norm)
-            if nums:
-                return f"{nums[0]} Crore"
-        
-        if 'lakh' in speech_norm or 'lac' in speech_norm:
-            nums = re.findall(r'(\d+(?:\.\d+)?)', speech_norm)
-            if nums:
-                return f"{nums[0]} Lakhs"
+        # Number with its unit attached: "50 lakhs", "1 crore", "1.5 cr"
+        match = _BUDGET_AMOUNT_RE.search(speech_norm)
+        if match:
+            unit = 'Crore' if match.group(2).startswith('cr') else 'Lakhs'
+            return f"{match.group(1)} {unit}"
+        
+        # Unit stated away from the number, or "budget is 80" (lakhs implied)
+        number = _NUMBER_RE.search(speech_norm)
+        if number:
+            unit_word = _BUDGET_UNIT_WORD_RE.search(speech_norm)
+            if unit_word:
+                unit = 'Crore' if unit_word.group(1) else 'Lakhs'
+                return f"{number.group(0)} {unit}"
+            if 'budget' in speech_norm:
+                return f"{number.group(0)} Lakhs"
         
         return speech  # Return as-is if can't parse
     
@@ -453,31 +938,40 @@ class VoiceHandler:
         # Common email patterns in voice
         speech = speech.lower().strip()
         
-        # Replace spoken words with symbols
-        speech = speech.replace(' at ', '@')
-        speech = speech.replace(' at the rate ', '@')
-        speech = speech.replace(' at rate ', '@')
-        speech = speech.replace(' dot ', '.')
-        speech = speech.replace(' period ', '.')
-        speech = speech.replace(' underscore ', '_')
+        # Replace spoken words with symbols in one pass (longest phrase first,
+        # so "at the rate" isn't consumed as "at")
+        speech = _EMAIL_SPOKEN_RE.sub(lambda m: _EMAIL_SPOKEN_SYMBOLS[m.group(1)], speech)
         
         # Remove spaces around @ and .
-        speech = re.sub(r'\s*@\s*', '@', speech)
-        speech = re.sub(r'\s*\.\s*', '.', speech)
+        speech = _EMAIL_SYMBOL_SPACE_RE.sub(r'\1', speech)
         
         # Look for email pattern
-        email_pattern = r'[\w.+-]+@[\w.-]+\.\w+'
-        match = re.search(email_pattern, speech)
+        match = _EMAIL_RE.search(speech)
         if match:
             return match.group(0)
         
         return speech  # Return cleaned version
     
+    def _lock_for(self, session_id: str) -> asyncio.Lock:
+        """Get or create the lock serializing turns for a session."""
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            if len(self._session_locks) >= self.MAX_SESSIONS:
+                # Drop idle locks of sessions that have expired from the store
+                for sid in [sid for sid, l in self._session_locks.items()
+                            if not l.locked() and sid not in self.sessions]:
+                    del self._session_locks[sid]
+            lock = self._session_locks[session_id] = asyncio.Lock()
+        return lock
+    
     def get_session(self, session_id: str) -> VoiceSession:
         """Get or create voice session."""
-        if session_id not in self.sessions:
-            self.sessions[session_id] = VoiceSession(session_id=session_id)
-        return self.sessions[session_id]
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = VoiceSession(session_id=session_id)
+        # Re-store on every access so the TTL measures idle time, not call length
+        self.sessions[session_id] = session
+        return session
     
     async def _enhance_with_llm(self, session: VoiceSession, user_input: str, base_response: str, context: str = "") -> str:
         """
@@ -490,14 +984,10 @@ class VoiceHandler:
         
         try:
             # Build conversation context
-            history = session.conversation_history[-4:] if session.conversation_history else []
+            history = list(session.conversation_history)[-4:]
             history_text = "\n".join([f"{h['role']}: {h['content']}" for h in history])
             
-            prompt = f"""You are a friendly real estate assistant on a phone call. 
-Make this response sound more natural and human-like for a voice call.
-Keep it short (1-2 sentences max) and conversational.
-
-Context: {context}
+            prompt = f"""Context: {context}
 Conversation so far:
 {history_text}
 User just said: "{user_input}"
@@ -506,10 +996,13 @@ Base response to deliver: {base_response}
 
 Rewrite this naturally (keep the same meaning, just make it sound more human):"""
 
-            enhanced = await self.llm_engine.generate(prompt, max_tokens=100)
+            response = await self.llm_engine.generate(
+                prompt, system_prompt=_ENHANCE_SYSTEM_PROMPT, max_tokens=100
+            )
+            enhanced = response.text.strip() if response.success else ""
             
-            if enhanced and len(enhanced) > 10:
-                return enhanced.strip()
+            if len(enhanced) > 10:
+                return enhanced
             return base_response
             
         except Exception as e:
@@ -531,28 +1024,42 @@ Rewrite this naturally (keep the same meaning, just make it sound more human):""
         if not self.llm_engine:
             return None
         
+        cache_key = (expected_type, _normalize(user_input))
+        cached = self._interpret_cache.get(cache_key, _CACHE_MISS)
+        if cached is not _CACHE_MISS:
+            return cached
+        
+        # Callers waiting on the same garble share one LLM request. Shielded
+        # so a hung-up caller doesn't cancel it for the others
+        pending = self._interpret_inflight.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._request_interpretation(cache_key, user_input, expected_type)
+            )
+            self._interpret_inflight[cache_key] = pending
+            pending.add_done_callback(lambda _: self._interpret_inflight.pop(cache_key, None))
+        return await asyncio.shield(pending)
+    
+    async def _request_interpretation(
+        self, cache_key: Tuple[str, str], user_input: str, expected_type: str
+    ) -> Optional[str]:
+        """Ask the LLM for an interpretation and cache the answer."""
         try:
-            prompt = f"""You are helping interpret a voice transcription from a phone call.
-The transcription might have accents or mispronunciations.
-
-Expected type of answer: {expected_type}
+            prompt = f"""Expected type of answer: {expected_type}
 Transcription: "{user_input}"
 
-What did the user most likely mean? Give just the interpreted value, nothing else.
-If you can't determine, say "UNCLEAR".
-
-Examples:
-- "noyda" for city → Noida
-- "too bhk" for bedrooms → 2 BHK
-- "yess please" for yes/no → yes
-
 Your interpretation:"""
 
-            result = await self.llm_engine.generate(prompt, max_tokens=50)
+            response = await self.llm_engine.generate(
+                prompt, system_prompt=_INTERPRET_SYSTEM_PROMPT, max_tokens=50
+            )
+            if not response.success:
+                return None
+            result = response.text.strip()
             
-            if result and "UNCLEAR" not in result.upper():
-                return result.strip()
-            return None
+            interpreted = result if result and "UNCLEAR" not in result.upper() else None
+            self._interpret_cache[cache_key] = interpreted
+            return interpreted
             
         except Exception as e:
             logger.debug(f"LLM interpretation failed: {e}")
@@ -574,24 +1081,14 @@ Your interpretation:"""
             return {}
         
         try:
-            prompt = f"""Extract property search requirements from this customer statement.
-Return ONLY a JSON object with these fields (use null for missing info):
-
-Fields to extract:
-- location: City name in India (e.g., Noida, Mumbai, Delhi, Bangalore)
-- property_category: "Residential" or "Commercial"  
-- property_type: Apartment/Flat, Villa/House, Plot, Office, Shop, etc.
-- bedroom: Number of bedrooms (e.g., "2 BHK", "3 BHK")
-- budget: Budget amount (e.g., "50 Lakhs", "1 Crore", "80 Lakhs to 1 Crore")
-- name: Customer's name if they mentioned it
-- timeline: When they want to buy (e.g., "immediately", "3 months", "6 months")
-- purpose: "investment", "self-use", "rental", etc.
-
-Customer said: "{speech}"
+            prompt = f"""Customer said: "{speech}"
 
 Return ONLY valid JSON, no other text:"""
 
-            result = await self.llm_engine.generate(prompt, max_tokens=200)
+            response = await self.llm_engine.generate(
+                prompt, system_prompt=_EXTRACT_SYSTEM_PROMPT, max_tokens=200
+            )
+            result = response.text if response.success else ""
             
             if result:
                 # Clean up response - extract JSON
@@ -661,8 +1158,21 @@ Return ONLY valid JSON, no other text:"""
         - Extracts all info using LLM
         - Jumps to verification if enough info collected
         - Falls back to stage-by-stage flow for simple answers
+        - Overlapping turns for the same session are serialized
         """
+        async with self._turn_semaphore, self._lock_for(session_id):
+            return await self._process_speech_locked(session_id, speech_text, lead_name, lead_phone)
+    
+    async def _process_speech_locked(
+        self,
+        session_id: str,
+        speech_text: str,
+        lead_name: str,
+        lead_phone: str
+    ) -> VoiceResponse:
+        """Process one turn; caller holds the session lock."""
         session = self.get_session(session_id)
+        # Stripped once here; stage handlers receive trimmed speech
         speech_text = speech_text.strip() if speech_text else ""
         
         logger.info(f"[Voice] Session {session_id}, Stage: {session.current_stage}, Input: '{speech_text}'")
@@ -678,17 +1188,20 @@ Return ONLY valid JSON, no other text:"""
                 'content': speech_text
             })
         
+        # Normalized for the rich-input keyword check; handlers get the raw text
+        speech_norm = self._normalize_text(speech_text)
+        
         # Check if this is rich input with multiple requirements (longer than 15 words or has property keywords)
-        words = speech_text.lower().split() if speech_text else []
+        words = speech_norm.split()
         property_keywords = ['bhk', 'bedroom', 'flat', 'apartment', 'villa', 'house', 'plot', 
                            'office', 'shop', 'lakh', 'crore', 'budget', 'noida', 'mumbai', 
                            'delhi', 'bangalore', 'pune', 'gurugram', 'looking', 'want', 'need']
         
-        has_property_keywords = sum(1 for kw in property_keywords if kw in speech_text.lower()) >= 2
+        has_property_keywords = sum(1 for kw in property_keywords if kw in speech_norm) >= 2
         is_rich_input = len(words) > 10 or has_property_keywords
         
         # Try to extract requirements from rich input
-        if is_rich_input and session.current_stage in ['interest_check', 'location', 'property_category', 'property_type', 'bedroom']:
+        if is_rich_input and session.current_stage in _RICH_INPUT_STAGES:
             extracted = await self._extract_requirements_from_speech(speech_text)
             
             if extracted and len(extracted) >= 2:
@@ -711,7 +1224,7 @@ Return ONLY valid JSON, no other text:"""
                 # Move to verification stage
                 response = VoiceResponse(
                     message=f"Got it! So you're looking for {summary}. Did I get that right?",
-                    next_stage='verify_requirements',
+                    next_stage=VoiceStage.VERIFY_REQUIREMENTS,
                     options=['Yes', 'No, let me correct'],
                     confidence=0.85
                 )
@@ -746,45 +1259,22 @@ Return ONLY valid JSON, no other text:"""
         if not flow:
             return self._create_error_response(session)
         
-        # Handle each stage
-        if stage == 'greeting':
-            return self._handle_greeting(session, speech)
-        elif stage == 'interest_check':
-            return self._handle_interest_check(session, speech)
-        elif stage == 'location':
-            return await self._handle_location(session, speech)
-        elif stage == 'property_category':
-            return self._handle_category(session, speech)
-        elif stage == 'property_type':
-            return await self._handle_property_type(session, speech)
-        elif stage == 'bedroom':
-            return await self._handle_bedroom(session, speech)
-        elif stage == 'verify_requirements':
-            return await self._handle_verify_requirements(session, speech)
-        elif stage == 'search_complete':
-            return await self._handle_search_complete(session, speech)
-        elif stage == 'ask_name':
-            return self._handle_ask_name(session, speech)
-        elif stage == 'budget':
-            return self._handle_budget(session, speech)
-        elif stage == 'phone_confirm':
-            return self._handle_email(session, speech)
-        elif stage == 'complete':
-            return self._handle_complete(session)
-        elif stage == 'thank_you':
-            return self._handle_thank_you(session)
-        else:
+        handler = self._stage_handlers.get(stage)
+        if handler is None:
             return self._create_error_response(session)
+        
+        return await handler(session, speech)
 
     async def _perform_search_and_format(self, session: VoiceSession) -> str:
         """Perform search and format results for speech."""
         if not self.property_searcher:
             return "I have noted your requirements. Would you like our property expert to call you with personalized recommendations?"
 
-        location = session.collected_data.get('location', '')
-        category = session.collected_data.get('property_category', '')
-        p_type = session.collected_data.get('property_type', '')
-        bedroom = session.collected_data.get('bedroom', '')
+        data = session.collected_data
+        location = data.get('location', '')
+        category = data.get('property_category', '')
+        p_type = data.get('property_type', '')
+        bedroom = data.get('bedroom', '')
         
         # Map category to 1 (Resi) or 4 (Comm) logic if needed, but searcher handles text
         # Clean up bedroom for searcher (extract standard BHK)
@@ -811,7 +1301,7 @@ Return ONLY valid JSON, no other text:"""
         else:
             return f"I looked for properties in {location} but didn't find exact matches right now. However, I can have our expert find off-market deals for you. Would you like a call back?"
 
-    def _handle_greeting(self, session: VoiceSession, speech: str) -> VoiceResponse:
+    async def _handle_greeting(self, session: VoiceSession, speech: str) -> VoiceResponse:
         """
         Handle greeting stage - confirm identity and introduce service.
         
@@ -829,13 +1319,11 @@ Return ONLY valid JSON, no other text:"""
         # If we're waiting for user's name after they said "no"
         if awaiting_name:
             # User provided their name
-            if speech and len(speech.strip()) > 1:
+            if len(speech) > 1:
                 # Extract name from speech (could be "My name is John" or just "John")
-                name_text = speech.strip()
+                name_text = speech
                 # Clean common prefixes
-                for prefix in ["my name is", "this is", "i am", "i'm", "call me"]:
-                    if name_text.lower().startswith(prefix):
-                        name_text = name_text[len(prefix):].strip()
+                name_text = _NAME_PREFIX_RE.sub('', name_text, count=1)
                 
                 session.collected_data['name'] = name_text.title()
                 session.collected_data['awaiting_name'] = False
@@ -851,14 +1339,14 @@ Return ONLY valid JSON, no other text:"""
                 
                 return VoiceResponse(
                     message=intro,
-                    next_stage='interest_check',
+                    next_stage=VoiceStage.INTEREST_CHECK,
                     options=['Yes', 'No'],
                     confidence=0.9
                 )
             else:
                 return VoiceResponse(
-                    message="I didn't catch that. Could you please tell me your name?",
-                    next_stage='greeting',
+                    message=self.FIXED_REPLIES['ask_name_again'],
+                    next_stage=VoiceStage.GREETING,
                     confidence=0.5
                 )
         
@@ -879,15 +1367,15 @@ Return ONLY valid JSON, no other text:"""
                 
                 return VoiceResponse(
                     message=intro,
-                    next_stage='interest_check',
+                    next_stage=VoiceStage.INTEREST_CHECK,
                     options=['Yes, I am', 'Not right now'],
                     confidence=confidence
                 )
             else:
                 # Already introduced, proceed to location
                 return VoiceResponse(
-                    message=f"Great! Which city are you looking for property in?",
-                    next_stage='location',
+                    message=self.FIXED_REPLIES['ask_city'],
+                    next_stage=VoiceStage.LOCATION,
                     confidence=confidence
                 )
                 
@@ -896,22 +1384,19 @@ Return ONLY valid JSON, no other text:"""
             session.collected_data['awaiting_name'] = True
             return VoiceResponse(
                 message="Oh, I apologize! May I know who I'm speaking with?",
-                next_stage='greeting',  # Stay on greeting to capture name
+                next_stage=VoiceStage.GREETING,  # Stay on greeting to capture name
                 confidence=0.8
             )
         else:
             # Unclear response - might be their name if we just asked
             # Or they might have said something unrelated
-            if speech and len(speech.strip()) > 2:
+            if len(speech) > 2:
                 # Could be their name or a greeting like "hello" "hi"
-                speech_lower = speech.lower().strip()
-                greetings = ['hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening']
-                
-                if any(g in speech_lower for g in greetings):
+                if _GREETING_RE.search(speech):
                     # They greeted back - confirm name again
                     return VoiceResponse(
                         message=f"Hello! Am I speaking with {name}?",
-                        next_stage='greeting',
+                        next_stage=VoiceStage.GREETING,
                         options=['Yes', 'No'],
                         confidence=0.7
                     )
@@ -921,20 +1406,20 @@ Return ONLY valid JSON, no other text:"""
                     session.collected_data['introduced'] = True
                     
                     return VoiceResponse(
-                        message=f"Great! I'm from RealtyAssistant, and I'd love to help you find the perfect property. Which city are you looking in?",
-                        next_stage='location',
+                        message=self.FIXED_REPLIES['intro_ask_city'],
+                        next_stage=VoiceStage.LOCATION,
                         confidence=0.6
                     )
             else:
                 # Very short/empty - ask again
                 return VoiceResponse(
                     message=f"I didn't quite catch that. Am I speaking with {name}?",
-                    next_stage='greeting',
+                    next_stage=VoiceStage.GREETING,
                     options=['Yes', 'No'],
                     confidence=0.5
                 )
     
-    def _handle_interest_check(self, session: VoiceSession, speech: str) -> VoiceResponse:
+    async def _handle_interest_check(self, session: VoiceSession, speech: str) -> VoiceResponse:
         """
         Handle interest check stage - ask if user is interested in property.
         
@@ -948,7 +1433,7 @@ Return ONLY valid JSON, no other text:"""
             name = session.collected_data.get('name', 'there')
             return VoiceResponse(
                 message=f"Excellent, {name}! I'd love to help you find the perfect property. Which city are you looking in?",
-                next_stage='location',
+                next_stage=VoiceStage.LOCATION,
                 options=['Noida', 'Mumbai', 'Delhi', 'Bangalore', 'Pune'],
                 confidence=confidence
             )
@@ -957,28 +1442,25 @@ Return ONLY valid JSON, no other text:"""
             name = session.collected_data.get('name', 'there')
             return VoiceResponse(
                 message=f"No worries, {name}! I completely understand. If you ever need help finding a property, feel free to reach out to RealtyAssistant. We're here to help. Have a wonderful day!",
-                next_stage='thank_you',
+                next_stage=VoiceStage.THANK_YOU,
                 is_complete=True,
                 collected_data=session.collected_data,
                 confidence=confidence
             )
         else:
             # Unclear - check for property-related keywords that indicate interest
-            speech_lower = speech.lower() if speech else ""
-            interest_keywords = ['looking', 'searching', 'want', 'need', 'buy', 'rent', 'property', 'flat', 'apartment', 'house', 'villa']
-            
-            if any(kw in speech_lower for kw in interest_keywords):
+            if speech and _INTEREST_RE.search(speech):
                 session.collected_data['interested'] = True
                 return VoiceResponse(
-                    message="Great! Which city are you interested in?",
-                    next_stage='location',
+                    message=self.FIXED_REPLIES['interested_ask_city'],
+                    next_stage=VoiceStage.LOCATION,
                     confidence=0.6
                 )
             else:
                 # Ask again
                 return VoiceResponse(
-                    message="I just wanted to check - are you currently looking for a property to buy or rent?",
-                    next_stage='interest_check',
+                    message=self.FIXED_REPLIES['interest_recheck'],
+                    next_stage=VoiceStage.INTEREST_CHECK,
                     options=['Yes', 'No'],
                     confidence=0.5
                 )
@@ -990,8 +1472,8 @@ Return ONLY valid JSON, no other text:"""
         if city and confidence >= 0.6:
             session.collected_data['location'] = city
             return VoiceResponse(
-                message=f"Great choice! {city} has some wonderful properties. Are you looking for a Residential or Commercial property?",
-                next_stage='property_category',
+                message=self._location_confirmation(city),
+                next_stage=VoiceStage.PROPERTY_CATEGORY,
                 options=['Residential', 'Commercial'],
                 confidence=confidence
             )
@@ -1011,7 +1493,7 @@ Return ONLY valid JSON, no other text:"""
                     logger.info(f"LLM interpreted '{speech}' as '{city}'")
                     return VoiceResponse(
                         message=f"Got it! {city} it is. Are you looking for a Residential or Commercial property?",
-                        next_stage='property_category',
+                        next_stage=VoiceStage.PROPERTY_CATEGORY,
                         options=['Residential', 'Commercial'],
                         confidence=0.7
                     )
@@ -1020,7 +1502,7 @@ Return ONLY valid JSON, no other text:"""
                     session.collected_data['location'] = interpreted.title()
                     return VoiceResponse(
                         message=f"I'll search for properties in {interpreted}. Are you looking for Residential or Commercial?",
-                        next_stage='property_category',
+                        next_stage=VoiceStage.PROPERTY_CATEGORY,
                         options=['Residential', 'Commercial'],
                         confidence=0.6
                     )
@@ -1031,18 +1513,18 @@ Return ONLY valid JSON, no other text:"""
                 session.collected_data['location'] = speech.title() if speech else 'Not Specified'
                 return VoiceResponse(
                     message=f"I'll note down {speech}. Are you looking for a Residential or Commercial property?",
-                    next_stage='property_category',
+                    next_stage=VoiceStage.PROPERTY_CATEGORY,
                     confidence=0.5
                 )
             
             return VoiceResponse(
-                message="I didn't quite catch that. Could you please tell me the city name again? For example, Noida, Mumbai, Delhi, or Bangalore?",
-                next_stage='location',
+                message=self.FIXED_REPLIES['city_retry'],
+                next_stage=VoiceStage.LOCATION,
                 options=['Noida', 'Mumbai', 'Delhi', 'Bangalore', 'Pune', 'Gurugram'],
                 confidence=0.3
             )
     
-    def _handle_category(self, session: VoiceSession, speech: str) -> VoiceResponse:
+    async def _handle_category(self, session: VoiceSession, speech: str) -> VoiceResponse:
         """Handle property category selection."""
         category, confidence = self._match_category(speech)
         
@@ -1051,15 +1533,15 @@ Return ONLY valid JSON, no other text:"""
             
             if 'commercial' in category.lower():
                 return VoiceResponse(
-                    message="Commercial property it is! What type are you looking for? Office space, Shop, or Showroom?",
-                    next_stage='property_type',
+                    message=self.FIXED_REPLIES['commercial_type'],
+                    next_stage=VoiceStage.PROPERTY_TYPE,
                     options=['Office Space', 'Shop', 'Showroom'],
                     confidence=confidence
                 )
             else:
                 return VoiceResponse(
-                    message="Perfect! What type of residential property? Apartment, Villa, or Plot?",
-                    next_stage='property_type',
+                    message=self.FIXED_REPLIES['residential_type'],
+                    next_stage=VoiceStage.PROPERTY_TYPE,
                     options=['Apartment', 'Villa', 'Plot'],
                     confidence=confidence
                 )
@@ -1068,14 +1550,14 @@ Return ONLY valid JSON, no other text:"""
             if session.retry_count > session.max_retries:
                 session.collected_data['property_category'] = 'Residential Properties'
                 return VoiceResponse(
-                    message="I'll assume Residential. What type of property? Apartment, Villa, or Plot?",
-                    next_stage='property_type',
+                    message=self.FIXED_REPLIES['assume_residential'],
+                    next_stage=VoiceStage.PROPERTY_TYPE,
                     confidence=0.5
                 )
             
             return VoiceResponse(
-                message="Would you like a Residential property like a flat or house? Or a Commercial property like a shop or office?",
-                next_stage='property_category',
+                message=self.FIXED_REPLIES['category_retry'],
+                next_stage=VoiceStage.PROPERTY_CATEGORY,
                 options=['Residential', 'Commercial'],
                 confidence=0.3
             )
@@ -1093,14 +1575,14 @@ Return ONLY valid JSON, no other text:"""
             
             return VoiceResponse(
                 message=search_speech,
-                next_stage='search_complete',
+                next_stage=VoiceStage.SEARCH_COMPLETE,
                 options=['Yes', 'No'],
                 confidence=confidence
             )
         else:
             return VoiceResponse(
                 message=f"Excellent, {ptype}! How many bedrooms do you need? 1 BHK, 2 BHK, 3 BHK, or 4 BHK?",
-                next_stage='bedroom',
+                next_stage=VoiceStage.BEDROOM,
                 options=['1 BHK', '2 BHK', '3 BHK', '4 BHK'],
                 confidence=confidence
             )
@@ -1121,7 +1603,7 @@ Return ONLY valid JSON, no other text:"""
             
             if interpreted:
                 # Try to extract BHK from LLM response
-                bhk_match = re.search(r'(\d+)\s*(?:bhk|bk|bedroom)?', interpreted.lower())
+                bhk_match = _BHK_LLM_RE.search(interpreted)
                 if bhk_match:
                     bedroom = f"{bhk_match.group(1)} BHK"
                     session.collected_data['bedroom'] = bedroom
@@ -1140,7 +1622,7 @@ Return ONLY valid JSON, no other text:"""
         
         return VoiceResponse(
             message=search_speech,
-            next_stage='search_complete',
+            next_stage=VoiceStage.SEARCH_COMPLETE,
             options=['Yes, call me', 'No thanks'],
             confidence=confidence
         )
@@ -1156,15 +1638,15 @@ Return ONLY valid JSON, no other text:"""
             
             return VoiceResponse(
                 message=search_speech,
-                next_stage='search_complete',
+                next_stage=VoiceStage.SEARCH_COMPLETE,
                 options=['Yes, call me', 'No thanks'],
                 confidence=confidence
             )
         elif consent is False:
             # User wants to correct - ask what's wrong
             return VoiceResponse(
-                message="No problem! Please tell me what you're looking for - the city, property type, bedrooms, budget - anything you'd like.",
-                next_stage='location',  # Reset to location for a fresh start
+                message=self.FIXED_REPLIES['requirements_retry'],
+                next_stage=VoiceStage.LOCATION,  # Reset to location for a fresh start
                 confidence=0.8
             )
         else:
@@ -1174,7 +1656,7 @@ Return ONLY valid JSON, no other text:"""
             
             return VoiceResponse(
                 message=f"I'll proceed with that. {search_speech}",
-                next_stage='search_complete',
+                next_stage=VoiceStage.SEARCH_COMPLETE,
                 options=['Yes', 'No'],
                 confidence=0.6
             )
@@ -1194,38 +1676,35 @@ Return ONLY valid JSON, no other text:"""
             if not has_real_name:
                 # Ask for name naturally before proceeding
                 return VoiceResponse(
-                    message="Wonderful! Before I connect you with our expert, may I know your good name?",
-                    next_stage='ask_name',
+                    message=self.FIXED_REPLIES['callback_ask_name'],
+                    next_stage=VoiceStage.ASK_NAME,
                     confidence=confidence
                 )
             else:
                 # Already have name - ask for budget
                 return VoiceResponse(
                     message=f"Great, {name}! What's your budget range for this property?",
-                    next_stage='budget',
+                    next_stage=VoiceStage.BUDGET,
                     confidence=confidence
                 )
                 
         elif consent is False:
             session.collected_data['consent'] = False
             return VoiceResponse(
-                message="No problem at all! Thank you for your time. If you ever need help finding a property, feel free to call RealtyAssistant. Have a wonderful day!",
-                next_stage='thank_you',
+                message=self.FIXED_REPLIES['callback_declined'],
+                next_stage=VoiceStage.THANK_YOU,
                 is_complete=True,
                 collected_data=session.collected_data,
                 confidence=confidence
             )
         else:
             # Unclear - check if they're asking about properties (wanting more info)
-            speech_lower = speech.lower() if speech else ""
-            info_keywords = ['tell', 'more', 'about', 'details', 'price', 'cost', 'where', 'which']
-            
-            if any(kw in speech_lower for kw in info_keywords):
+            if speech and _INFO_REQUEST_RE.search(speech):
                 # They want more info
                 location = session.collected_data.get('location', 'the area')
                 return VoiceResponse(
                     message=f"I can share more details! We have several great options in {location}. Would you like our property expert to call you with detailed information and virtual tours?",
-                    next_stage='search_complete',
+                    next_stage=VoiceStage.SEARCH_COMPLETE,
                     options=['Yes', 'No'],
                     confidence=0.6
                 )
@@ -1234,27 +1713,25 @@ Return ONLY valid JSON, no other text:"""
                 session.collected_data['consent'] = True
                 if not has_real_name:
                     return VoiceResponse(
-                        message="I'll arrange a callback for you. May I have your name please?",
-                        next_stage='ask_name',
+                        message=self.FIXED_REPLIES['callback_arranged'],
+                        next_stage=VoiceStage.ASK_NAME,
                         confidence=0.5
                     )
                 else:
                     return VoiceResponse(
                         message=f"Alright {name}! What's your budget for this property?",
-                        next_stage='budget',
+                        next_stage=VoiceStage.BUDGET,
                         confidence=0.5
                     )
     
-    def _handle_ask_name(self, session: VoiceSession, speech: str) -> VoiceResponse:
+    async def _handle_ask_name(self, session: VoiceSession, speech: str) -> VoiceResponse:
         """Handle name collection in middle of conversation."""
-        if speech and len(speech.strip()) > 1:
+        if len(speech) > 1:
             # Extract name from speech
-            name_text = speech.strip()
+            name_text = speech
             
             # Clean common prefixes
-            for prefix in ["my name is", "this is", "i am", "i'm", "call me", "it's", "its"]:
-                if name_text.lower().startswith(prefix):
-                    name_text = name_text[len(prefix):].strip()
+            name_text = _NAME_PREFIX_RE.sub('', name_text, count=1)
             
             # Clean trailing pleasantries
             name_text = name_text.split(',')[0].strip()  # "John, nice to meet you" -> "John"
@@ -1264,17 +1741,17 @@ Return ONLY valid JSON, no other text:"""
             
             return VoiceResponse(
                 message=f"Nice to meet you, {name_text.title()}! What's your budget range for the property?",
-                next_stage='budget',
+                next_stage=VoiceStage.BUDGET,
                 confidence=0.9
             )
         else:
             return VoiceResponse(
-                message="I didn't catch your name. Could you please tell me your name?",
-                next_stage='ask_name',
+                message=self.FIXED_REPLIES['name_retry'],
+                next_stage=VoiceStage.ASK_NAME,
                 confidence=0.5
             )
     
-    def _handle_consent(self, session: VoiceSession, speech: str) -> VoiceResponse:
+    async def _handle_consent(self, session: VoiceSession, speech: str) -> VoiceResponse:
         """Legacy consent handler - redirects to search_complete."""
         # This is kept for backward compatibility
         consent, confidence = self._match_consent(speech)
@@ -1283,14 +1760,14 @@ Return ONLY valid JSON, no other text:"""
             session.collected_data['consent'] = True
             return VoiceResponse(
                 message="Great! What's your budget range for this property?",
-                next_stage='budget',
+                next_stage=VoiceStage.BUDGET,
                 confidence=confidence
             )
         elif consent is False:
             session.collected_data['consent'] = False
             return VoiceResponse(
                 message="No problem! Thank you for your interest in RealtyAssistant. Feel free to call us anytime. Have a wonderful day!",
-                next_stage='thank_you',
+                next_stage=VoiceStage.THANK_YOU,
                 is_complete=True,
                 collected_data=session.collected_data,
                 confidence=confidence
@@ -1300,11 +1777,11 @@ Return ONLY valid JSON, no other text:"""
             session.collected_data['consent'] = True
             return VoiceResponse(
                 message="I'll have our expert give you a call. What's your budget range?",
-                next_stage='budget',
+                next_stage=VoiceStage.BUDGET,
                 confidence=0.5
             )
     
-    def _handle_budget(self, session: VoiceSession, speech: str) -> VoiceResponse:
+    async def _handle_budget(self, session: VoiceSession, speech: str) -> VoiceResponse:
         """Handle budget input."""
         budget = self._extract_budget(speech)
         session.collected_data['budget'] = budget
@@ -1313,55 +1790,59 @@ Return ONLY valid JSON, no other text:"""
         
         return VoiceResponse(
             message=f"Noted, budget of {budget}. Our expert will call you at {phone}. Can you share your email address for property alerts?",
-            next_stage='phone_confirm',
+            next_stage=VoiceStage.PHONE_CONFIRM,
             confidence=0.8
         )
     
-    def _handle_email(self, session: VoiceSession, speech: str) -> VoiceResponse:
+    async def _handle_email(self, session: VoiceSession, speech: str) -> VoiceResponse:
         """Handle email input and complete the call."""
         email = self._extract_email(speech)
         session.collected_data['email'] = email
         
         # Get the completion message directly
-        name = session.collected_data.get('name', 'there')
-        location = session.collected_data.get('location', 'your preferred area')
-        phone = session.collected_data.get('phone', 'your number')
-        bedroom = session.collected_data.get('bedroom', '')
-        property_type = session.collected_data.get('property_type', '')
+        data = session.collected_data
+        name = data.get('name', 'there')
+        location = data.get('location', 'your preferred area')
+        phone = data.get('phone', 'your number')
+        bedroom = data.get('bedroom', '')
+        property_type = data.get('property_type', '')
         
         # Create a natural, personalized farewell
-        farewell = f"Thank you so much, {name}! I've saved all your preferences. "
-        farewell += f"You're looking for a {bedroom} {property_type} in {location}. "
-        farewell += f"Our property expert will call you shortly at {phone} with personalized recommendations. "
-        farewell += "Have a wonderful day!"
+        farewell = (
+            f"Thank you so much, {name}! I've saved all your preferences. "
+            f"You're looking for a {bedroom} {property_type} in {location}. "
+            f"Our property expert will call you shortly at {phone} with personalized recommendations. "
+            "Have a wonderful day!"
+        )
         
         return VoiceResponse(
             message=farewell,
-            next_stage='complete',
+            next_stage=VoiceStage.COMPLETE,
             is_complete=True,
             collected_data=session.collected_data,
             confidence=0.95
         )
     
-    def _handle_complete(self, session: VoiceSession) -> VoiceResponse:
+    async def _handle_complete(self, session: VoiceSession, speech: str = "") -> VoiceResponse:
         """Handle conversation completion."""
-        name = session.collected_data.get('name', 'there')
-        location = session.collected_data.get('location', 'your preferred area')
-        phone = session.collected_data.get('phone', '')
+        data = session.collected_data
+        name = data.get('name', 'there')
+        location = data.get('location', 'your preferred area')
+        phone = data.get('phone', '')
         
         return VoiceResponse(
             message=f"Thank you, {name}! I've saved your preferences. Our property expert will call you at {phone} with matching properties in {location}. Have a wonderful day!",
-            next_stage='complete',
+            next_stage=VoiceStage.COMPLETE,
             is_complete=True,
             collected_data=session.collected_data,
             confidence=1.0
         )
     
-    def _handle_thank_you(self, session: VoiceSession) -> VoiceResponse:
+    async def _handle_thank_you(self, session: VoiceSession, speech: str = "") -> VoiceResponse:
         """Handle thank you (declined consent)."""
         return VoiceResponse(
-            message="Thank you for your time! Feel free to call us back anytime. Goodbye!",
-            next_stage='thank_you',
+            message=self.THANK_YOU_MESSAGE,
+            next_stage=VoiceStage.THANK_YOU,
             is_complete=True,
             collected_data=session.collected_data,
             confidence=1.0
@@ -1369,32 +1850,100 @@ Return ONLY valid JSON, no other text:"""
     
     def _create_error_response(self, session: VoiceSession) -> VoiceResponse:
         """Create error/fallback response."""
-        return VoiceResponse(
-            message="I apologize, I'm having trouble understanding. Let me transfer you to a human agent. Please hold.",
-            next_stage='error',
-            is_complete=True,
-            confidence=0.0
-        )
+        return self.ERROR_RESPONSE
+    
+    async def warm_up(self):
+        """
+        Warm the engines behind a call so the first caller doesn't wait.
+        
+        Loads the local LLM and synthesizes the fixed responses and city
+        confirmations into the TTS cache concurrently. Safe to run as a
+        background task.
+        """
+        from .tts_engine import get_tts_engine
+        
+        tasks = [get_tts_engine().prewarm([*self.static_messages(), *self.city_messages()])]
+        if self.llm_engine is not None:
+            tasks.append(self.llm_engine.warmup())
+        
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    @classmethod
+    def static_messages(cls) -> List[str]:
+        """
+        Responses that never vary between calls, for TTS cache prewarming.
+        
+        Returns:
+            Fixed handler replies plus the thank-you and error lines
+        """
+        messages = list(cls.FIXED_REPLIES.values())
+        messages.append(cls.THANK_YOU_MESSAGE)
+        messages.append(cls.ERROR_RESPONSE.message)
+        return messages
+    
+    @staticmethod
+    def _location_confirmation(city: str) -> str:
+        """Reply when a city is recognized."""
+        return f"Great choice! {city} has some wonderful properties. Are you looking for a Residential or Commercial property?"
+    
+    @classmethod
+    def city_messages(cls) -> List[str]:
+        """
+        Location confirmations for every known city, for TTS cache prewarming.
+        
+        The city is the only slot in the most common reply of the call,
+        so the full set is small enough to synthesize ahead of time.
+        
+        Returns:
+            One confirmation per canonical city
+        """
+        return [cls._location_confirmation(city.title()) for city in cls.CITY_VARIATIONS]
     
     def get_initial_greeting(self, lead_name: str = "Customer") -> str:
         """Get the initial greeting for a new call."""
-        return f"Hello! This is RealtyAssistant calling about your property enquiry. Am I speaking with {lead_name}?"
+        return _initial_greeting(lead_name)
     
     def clear_session(self, session_id: str):
-        """Clear a session."""
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        """
+        Clear a session.
+        
+        Stays synchronous: it only pops dict entries and never awaits, so
+        it cannot interleave with a turn on the event loop. A turn already
+        holding the removed lock finishes on its own session object.
+        """
+        self.sessions.pop(session_id, None)
+        self._session_locks.pop(session_id, None)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get session store occupancy for monitoring."""
+        if TTLCache is not None:
+            # Expiry is lazy; drop idle sessions so they aren't counted
+            self.sessions.expire()
+        return {
+            "active_sessions": len(self.sessions),
+            "max_sessions": self.MAX_SESSIONS,
+            "session_ttl_seconds": self.SESSION_TTL_SECONDS if TTLCache is not None else None,
+            "interpretations_cached": len(self._interpret_cache)
+        }
+
+
+# Lookups are built once for the base class; subclasses via __init_subclass__
+VoiceHandler._build_reverse_lookups()
 
 
 # Singleton instance
 _voice_handler: Optional[VoiceHandler] = None
+_voice_handler_lock = threading.Lock()
 
 
 def get_voice_handler(llm_engine=None, property_searcher=None) -> VoiceHandler:
     """Get or create singleton VoiceHandler instance."""
     global _voice_handler
     
+    # Lock only on first creation; later calls return the instance directly
     if _voice_handler is None:
-        _voice_handler = VoiceHandler(llm_engine=llm_engine, property_searcher=property_searcher)
+        with _voice_handler_lock:
+            if _voice_handler is None:
+                _voice_handler = VoiceHandler(llm_engine=llm_engine, property_searcher=property_searcher)
     
     return _voice_handler
@@ -8,14 +8,28 @@ Optimized for real-time transcription with minimal latency.
 
 import os
 import io
+import math
+import hashlib
 import logging
+import threading
 from typing import Optional, Tuple
 from pathlib import Path
+from collections import OrderedDict
 
 import numpy as np
 
+try:
+    # Imported up front so the first live call doesn't pay scipy's import
+    from scipy.signal import resample_poly
+except ImportError:
+    resample_poly = None
+
 logger = logging.getLogger(__name__)
 
+# Full-scale PCM -> [-1, 1) float32 factors
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+_INT32_SCALE = np.float32(1.0 / 2147483648.0)
+
 
 class WhisperEngine:
     """
@@ -34,11 +48,15 @@ class WhisperEngine:
         "distil-large-v3"
     ]
     
+    # Transcriptions kept for repeated audio files
+    FILE_CACHE_SIZE = 256
+    
     def __init__(
         self,
         model_name: str = "base.en",
         device: str = "cpu",
-        compute_type: str = "int8"
+        compute_type: str = "int8",
+        beam_size: int = 1
     ):
         """
         Initialize the Whisper engine.
@@ -47,23 +65,39 @@ class WhisperEngine:
             model_name: Name of the whisper model to use
             device: Device for inference (cpu for this project)
             compute_type: Quantization type for CPU (int8 recommended)
+            beam_size: Decoding beams; 1 (greedy) keeps short voice turns
+                fast, higher values trade latency for accuracy
         """
         self.model_name = model_name
         self.device = device
         self.compute_type = compute_type
+        self.beam_size = beam_size
         self.model = None
+        self._file_cache: "OrderedDict[Tuple[str, str, int], Tuple[str, float]]" = OrderedDict()
+        self._file_cache_lock = threading.Lock()
         self._initialized = False
+        self._init_lock = threading.Lock()
         
     def initialize(self) -> bool:
         """
         Lazy initialization of the Whisper model.
         
+        Safe to call from a background warm-up thread while a request
+        is also waiting on it; the model is loaded once.
+        
         Returns:
             True if initialization successful, False otherwise
         """
         if self._initialized:
             return True
-            
+        
+        with self._init_lock:
+            if self._initialized:
+                return True
+            return self._load_model()
+    
+    def _load_model(self) -> bool:
+        """Load the model; called with the init lock held."""
         try:
             from faster_whisper import WhisperModel
             
@@ -93,7 +127,8 @@ class WhisperEngine:
         self,
         audio_data: np.ndarray,
         sample_rate: int = 16000,
-        language: str = "en"
+        language: str = "en",
+        beam_size: Optional[int] = None
     ) -> Tuple[str, float]:
         """
         Transcribe audio data to text.
@@ -102,6 +137,7 @@ class WhisperEngine:
             audio_data: Numpy array of audio samples
             sample_rate: Audio sample rate (16kHz recommended)
             language: Language code for transcription
+            beam_size: Override for the engine's beam size
             
         Returns:
             Tuple of (transcription text, confidence score)
@@ -118,7 +154,7 @@ class WhisperEngine:
             segments, info = self.model.transcribe(
                 audio_data,
                 language=language,
-                beam_size=5,
+                beam_size=beam_size or self.beam_size,
                 best_of=5,
                 temperature=0.0,
                 vad_filter=True,
@@ -128,25 +164,12 @@ class WhisperEngine:
                 )
             )
             
-            # Collect all segments
-            full_text = ""
-            total_confidence = 0.0
-            segment_count = 0
+            text, confidence_score = self._collect_segments(segments)
             
-            for segment in segments:
-                full_text += segment.text
-                total_confidence += segment.avg_logprob
-                segment_count += 1
-            
-            # Calculate average confidence
-            avg_confidence = (total_confidence / segment_count) if segment_count > 0 else 0.0
-            # Convert log probability to a 0-1 confidence score
-            confidence_score = min(1.0, max(0.0, 1.0 + avg_confidence))
-            
-            logger.debug(f"Transcription: {full_text.strip()}")
+            logger.debug(f"Transcription: {text}")
             logger.debug(f"Confidence: {confidence_score:.2f}")
             
-            return full_text.strip(), confidence_score
+            return text, confidence_score
             
         except Exception as e:
             logger.error(f"Transcription error: {e}")
@@ -155,7 +178,8 @@ class WhisperEngine:
     def transcribe_file(
         self,
         file_path: str,
-        language: str = "en"
+        language: str = "en",
+        beam_size: Optional[int] = None
     ) -> Tuple[str, float]:
         """
         Transcribe audio from a file.
@@ -163,6 +187,8 @@ class WhisperEngine:
         Args:
             file_path: Path to the audio file
             language: Language code for transcription
+            beam_size: Override for the engine's beam size (e.g. 5 for
+                offline recordings where accuracy matters more than latency)
             
         Returns:
             Tuple of (transcription text, confidence score)
@@ -172,37 +198,67 @@ class WhisperEngine:
                 return "", 0.0
         
         try:
-            if not Path(file_path).exists():
+            path = Path(file_path)
+            if not path.exists():
                 logger.error(f"Audio file not found: {file_path}")
                 return "", 0.0
             
+            # Same audio bytes with the same settings transcribe the same way,
+            # whatever the (often temporary) file is called
+            beam_size = beam_size or self.beam_size
+            digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+            cache_key = (digest, language, beam_size)
+            with self._file_cache_lock:
+                cached = self._file_cache.get(cache_key)
+                if cached is not None:
+                    self._file_cache.move_to_end(cache_key)
+                    return cached
+            
             segments, info = self.model.transcribe(
                 file_path,
                 language=language,
-                beam_size=5,
+                beam_size=beam_size,
                 best_of=5,
                 temperature=0.0,
                 vad_filter=True
             )
             
-            full_text = ""
-            total_confidence = 0.0
-            segment_count = 0
-            
-            for segment in segments:
-                full_text += segment.text
-                total_confidence += segment.avg_logprob
-                segment_count += 1
-            
-            avg_confidence = (total_confidence / segment_count) if segment_count > 0 else 0.0
-            confidence_score = min(1.0, max(0.0, 1.0 + avg_confidence))
-            
-            return full_text.strip(), confidence_score
+            result = self._collect_segments(segments)
+            with self._file_cache_lock:
+                self._file_cache[cache_key] = result
+                while len(self._file_cache) > self.FILE_CACHE_SIZE:
+                    self._file_cache.popitem(last=False)
+            return result
             
         except Exception as e:
             logger.error(f"File transcription error: {e}")
             return "", 0.0
     
+    @staticmethod
+    def _collect_segments(segments) -> Tuple[str, float]:
+        """
+        Join streamed segments into one transcription.
+        
+        Args:
+            segments: Segment iterator returned by WhisperModel.transcribe
+            
+        Returns:
+            Tuple of (transcription text, confidence score)
+        """
+        parts = []
+        logprobs = []
+        
+        for segment in segments:
+            parts.append(segment.text)
+            logprobs.append(segment.avg_logprob)
+        
+        # Calculate average confidence
+        avg_confidence = (sum(logprobs) / len(logprobs)) if logprobs else 0.0
+        # Convert log probability to a 0-1 confidence score
+        confidence_score = min(1.0, max(0.0, 1.0 + avg_confidence))
+        
+        return "".join(parts).strip(), confidence_score
+    
     def _preprocess_audio(
         self,
         audio_data: np.ndarray,
@@ -218,12 +274,17 @@ class WhisperEngine:
         Returns:
             Preprocessed audio array
         """
-        # Convert to float32 if needed
+        # Already what the model expects (float32 mono 16kHz)
+        if audio_data.dtype == np.float32 and audio_data.ndim == 1 and sample_rate == 16000:
+            return audio_data
+        
+        # Convert to float32 if needed; the multiply casts and scales in
+        # one pass instead of allocating a cast copy and then a quotient
         if audio_data.dtype != np.float32:
             if audio_data.dtype == np.int16:
-                audio_data = audio_data.astype(np.float32) / 32768.0
+                audio_data = np.multiply(audio_data, _INT16_SCALE, dtype=np.float32)
             elif audio_data.dtype == np.int32:
-                audio_data = audio_data.astype(np.float32) / 2147483648.0
+                audio_data = np.multiply(audio_data, _INT32_SCALE, dtype=np.float32)
             else:
                 audio_data = audio_data.astype(np.float32)
         
@@ -231,11 +292,22 @@ class WhisperEngine:
         if len(audio_data.shape) > 1 and audio_data.shape[1] > 1:
             audio_data = np.mean(audio_data, axis=1)
         
-        # Resample to 16kHz if needed
+        # Resample to 16kHz if needed. Polyphase filtering works in the time
+        # domain at the reduced up/down ratio (8k -> 16k is 2/1), which is
+        # much cheaper than an FFT over the whole clip
         if sample_rate != 16000:
-            from scipy import signal
-            num_samples = int(len(audio_data) * 16000 / sample_rate)
-            audio_data = signal.resample(audio_data, num_samples)
+            if resample_poly is not None:
+                factor = math.gcd(16000, sample_rate)
+                audio_data = resample_poly(
+                    audio_data, 16000 // factor, sample_rate // factor
+                ).astype(np.float32, copy=False)
+            else:
+                logger.warning("scipy not installed, resampling with linear interpolation")
+                num_samples = int(len(audio_data) * 16000 / sample_rate)
+                positions = np.linspace(0, len(audio_data) - 1, num_samples)
+                audio_data = np.interp(
+                    positions, np.arange(len(audio_data)), audio_data
+                ).astype(np.float32)
         
         return audio_data
     
@@ -253,6 +325,7 @@ class WhisperEngine:
             "model_name": self.model_name,
             "device": self.device,
             "compute_type": self.compute_type,
+            "beam_size": self.beam_size,
             "initialized": self._initialized,
             "available": self.is_available()
         }
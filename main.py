@@ -10,6 +10,7 @@ import os
 import sys
 import asyncio
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
@@ -19,6 +20,11 @@ import uvicorn
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, File, UploadFile, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
+try:
+    import orjson  # noqa: F401 - required by ORJSONResponse
+    from fastapi.responses import ORJSONResponse as VoiceJSONResponse
+except ImportError:
+    VoiceJSONResponse = JSONResponse
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 from rich.console import Console
@@ -39,6 +45,7 @@ from models import (
 )
 from agent import QualificationAgent
 from core import LLMEngine, PropertySearcher, WhisperEngine, GeminiFallback
+from core.search_scout import close_http_client
 
 # Configure logging
 console = Console()
@@ -83,7 +90,10 @@ async def lifespan(app: FastAPI):
         gemini_api_key=os.getenv("GEMINI_API_KEY")
     )
     
-    _property_searcher = PropertySearcher(headless=True)
+    _property_searcher = PropertySearcher(
+        headless=True,
+        preflight=os.getenv("ENABLE_SEARCH_PREFLIGHT", "false").lower() == "true"
+    )
     
     _agent = QualificationAgent(
         llm_engine=_llm_engine,
@@ -97,7 +107,17 @@ async def lifespan(app: FastAPI):
     
     # Initialize Voice Handler
     from core.voice_handler import get_voice_handler
-    get_voice_handler(llm_engine=_llm_engine, property_searcher=_property_searcher)
+    voice_handler = get_voice_handler(llm_engine=_llm_engine, property_searcher=_property_searcher)
+    
+    # Load the LLM and fill the TTS cache with fixed phrases in the background
+    _warmup_task = asyncio.create_task(voice_handler.warm_up())
+    
+    # Load the Whisper model off the event loop so the first voice turn
+    # doesn't pay for it (daemon, so a slow load never blocks shutdown)
+    from core.whisper_engine import get_whisper_engine
+    whisper = get_whisper_engine()
+    if whisper.is_available():
+        threading.Thread(target=whisper.initialize, name="whisper-warmup", daemon=True).start()
     
     logger.info("RealtyAssistant AI Agent ready!")
     
@@ -105,8 +125,10 @@ async def lifespan(app: FastAPI):
     
     # Cleanup
     logger.info("Shutting down...")
+    _warmup_task.cancel()
     if _property_searcher:
         await _property_searcher.close()
+    await close_http_client()
 
 
 # =============================================================================
@@ -187,7 +209,8 @@ async def get_status():
             "llm_engine": _llm_engine.get_status() if _llm_engine else None,
             "property_searcher": {
                 "available": _property_searcher.is_available() if _property_searcher else False
-            }
+            },
+            "voice_handler": get_voice_handler().get_status()
         }
     }
 
@@ -1007,7 +1030,8 @@ async def voice_process_speech(request: VoiceSpeechRequest):
             # Save lead to database
             await _save_voice_lead(request.session_id, response.collected_data)
         
-        return result
+        # Plain JSON values only, so skip jsonable_encoder and serialize directly
+        return VoiceJSONResponse(result)
         
     except Exception as e:
         logger.error(f"Voice processing error: {e}")
@@ -1051,8 +1075,10 @@ async def voice_process_audio(
     Modern replacement for process-speech.
     """
     from core.whisper_engine import get_whisper_engine
+    from core.tts_engine import get_tts_engine
     import shutil
     import tempfile
+    import base64
     
     # Log request details for debugging
     logger.info(f"Voice Request: session={session_id}, content_type={request.headers.get('content-type')}")
@@ -1094,21 +1120,11 @@ async def voice_process_audio(
             lead_phone=""
         )
         
-        # Generate TTS Audio
+        # Generate TTS Audio (cached by text, so repeated phrases skip synthesis)
         audio_base64 = None
-        try:
-             from gtts import gTTS
-             import io
-             import base64
-             
-             # Use 'co.in' for Indian accent if available, or 'en'
-             tts = gTTS(text=response.message, lang='en', tld='co.in') 
-             mp3_fp = io.BytesIO()
-             tts.write_to_fp(mp3_fp)
-             mp3_fp.seek(0)
-             audio_base64 = base64.b64encode(mp3_fp.read()).decode('utf-8')
-        except Exception as e:
-             logger.error(f"TTS Error: {e}")
+        audio_bytes = await get_tts_engine().synthesize_async(response.message)
+        if audio_bytes:
+             audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
         
         result = {
             "success": True,
@@ -1127,7 +1143,8 @@ async def voice_process_audio(
             result["collected_data"] = response.collected_data
             await _save_voice_lead(session_id, response.collected_data)
         
-        return result
+        # Carries the base64 audio clip, where orjson is much faster than json
+        return VoiceJSONResponse(result)
 
     except Exception as e:
         logger.error(f"Audio processing error: {e}")
@@ -1325,7 +1342,10 @@ async def run_simulation(
     
     # Initialize components
     _llm_engine = LLMEngine()
-    _property_searcher = PropertySearcher(headless=True)
+    _property_searcher = PropertySearcher(
+        headless=True,
+        preflight=os.getenv("ENABLE_SEARCH_PREFLIGHT", "false").lower() == "true"
+    )
     _agent = QualificationAgent(
         llm_engine=_llm_engine,
         property_searcher=_property_searcher
@@ -1358,6 +1378,7 @@ async def run_simulation(
     
     # Cleanup
     await _property_searcher.close()
+    await close_http_client()
 
 
 def main():
@@ -24,6 +24,7 @@ from models import (
     PropertyType
 )
 from core.search_scout import PropertySearcher
+from core.voice_handler import VoiceHandler, VoiceStage, _LRUSessions
 from core.llm_engine import LLMEngine, LLMResponse, LLMProvider
 from core.fallback import GeminiFallback
 from agent import QualificationAgent
@@ -173,7 +174,13 @@ class TestBudgetParsing:
         min_val, max_val = PropertySearcher.parse_budget("50 to 60 lakhs")
         assert min_val == 5000000
         assert max_val == 6000000
-    
+
+    def test_range_shares_trailing_unit(self):
+        """Test that a bare first number takes the range's trailing unit."""
+        min_val, max_val = PropertySearcher.parse_budget("5 to 8 lakhs")
+        assert min_val == 500000
+        assert max_val == 800000
+
     def test_mixed_formats(self):
         """Test various budget formats."""
         test_cases = [
@@ -256,7 +263,7 @@ class TestQualificationAgent:
     
     @pytest.mark.asyncio
     async def test_full_qualification_flow(
-        self, sample_lead, mock_llm_engine, mock_property_searcher
+        self, sample_lead, mock_llm_engine, mock_property_searcher, tmp_path
     ):
         """Test complete qualification flow."""
         # Setup mock responses for different stages
@@ -286,8 +293,8 @@ class TestQualificationAgent:
         agent = QualificationAgent(
             llm_engine=mock_llm_engine,
             property_searcher=mock_property_searcher,
-            logs_dir="tests/data/logs",
-            leads_dir="tests/data/leads"
+            logs_dir=str(tmp_path / "logs"),
+            leads_dir=str(tmp_path / "leads")
         )
         
         summary = await agent.qualify_lead(sample_lead)
@@ -365,6 +372,387 @@ class TestPropertySearcher:
         available = searcher.is_available()
         assert isinstance(available, bool)
 
+    def test_search_sync_reuses_background_loop(self):
+        """Test sync searches run on one persistent event loop."""
+        from core.search_scout import PropertySearchResult
+
+        searcher = PropertySearcher()
+        searcher.search = AsyncMock(return_value=PropertySearchResult(
+            count=0, properties=[], query_params={}, success=True
+        ))
+
+        searcher.search_sync("Noida", "Residential")
+        loop = searcher._bg_loop
+        searcher.search_sync("Pune", "Residential")
+
+        assert searcher._bg_loop is loop
+        assert loop.is_running()
+        assert searcher.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_preflight_skips_browser_for_empty_results(self):
+        """Test an empty server-rendered page returns without a browser."""
+        empty_page = Mock(status_code=200, text='<div id="property"><p>No results</p></div>')
+        client = Mock()
+        client.get = AsyncMock(return_value=empty_page)
+
+        searcher = PropertySearcher(preflight=True)
+        searcher.initialize = AsyncMock(return_value=True)
+
+        with patch("core.search_scout.get_http_client", return_value=client):
+            result = await searcher.search("Agra", "Commercial")
+
+        assert result.success is True
+        assert result.count == 0
+        searcher.initialize.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_preflight_off_by_default_and_ignores_loose_classes(self):
+        """Test the probe is opt-in and only trusts the listing container."""
+        client = Mock()
+        client.get = AsyncMock(return_value=Mock(
+            status_code=200, text='<section class="featured-properties"></section>'
+        ))
+
+        searcher = PropertySearcher()
+        searcher.initialize = AsyncMock(return_value=False)
+
+        with patch("core.search_scout.get_http_client", return_value=client):
+            result = await searcher.search("Agra", "Commercial")
+            assert await searcher._preflight_is_empty("https://example.test") is False
+
+        assert searcher.preflight is False
+        assert result.success is False
+        searcher.initialize.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_shared_browser_outlives_other_searchers(self):
+        """Test one searcher closing leaves the shared browser to the rest."""
+        browsers = []
+
+        def launch(**kwargs):
+            browser = Mock(is_connected=Mock(return_value=True), close=AsyncMock())
+            browsers.append(browser)
+            return browser
+
+        playwright = Mock(stop=AsyncMock())
+        playwright.chromium.launch = AsyncMock(side_effect=launch)
+        starter = Mock(start=AsyncMock(return_value=playwright))
+
+        first, second = PropertySearcher(), PropertySearcher()
+        with patch("playwright.async_api.async_playwright", return_value=starter):
+            assert await first.initialize() and await second.initialize()
+            assert first._browser is second._browser
+
+            await first.close()
+            browsers[0].close.assert_not_awaited()
+
+            # A crashed browser is replaced and its last user closes it
+            browsers[0].is_connected.return_value = False
+            assert await second.initialize()
+            assert second._browser is browsers[1]
+            browsers[0].close.assert_awaited()
+
+            await second.close()
+            browsers[1].close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_searches_launch_one_browser(self):
+        """Test racing initialize() calls share a single Chromium launch."""
+        async def launch(**kwargs):
+            await asyncio.sleep(0)
+            return Mock(is_connected=Mock(return_value=True), close=AsyncMock())
+
+        playwright = Mock(stop=AsyncMock())
+        playwright.chromium.launch = AsyncMock(side_effect=launch)
+        starter = Mock(start=AsyncMock(return_value=playwright))
+
+        shared, other = PropertySearcher(), PropertySearcher()
+        with patch("playwright.async_api.async_playwright", return_value=starter):
+            results = await asyncio.gather(
+                shared.initialize(), shared.initialize(), other.initialize()
+            )
+            assert all(results)
+            playwright.chromium.launch.assert_awaited_once()
+            assert shared._shared is other._shared
+            assert shared._shared.refs == 2
+
+            browser = shared._browser
+            await shared.close()
+            browser.close.assert_not_awaited()
+            await other.close()
+            browser.close.assert_awaited_once()
+
+    def test_http_client_is_per_loop(self):
+        """Test each event loop gets its own client and searchers don't close it."""
+        from core.search_scout import get_http_client, close_http_client
+
+        async def use_client():
+            client = get_http_client()
+            await PropertySearcher().close()
+            assert get_http_client() is client and not client.is_closed
+            return client
+
+        first = asyncio.run(use_client())
+        second = asyncio.run(use_client())
+        assert first is not second
+
+        async def shutdown():
+            client = get_http_client()
+            await close_http_client()
+            return client
+
+        assert asyncio.run(shutdown()).is_closed
+
+    def test_asset_cache_ttl(self):
+        """Test only shared, max-age responses are cached."""
+        from core.search_scout import _cache_ttl
+
+        assert _cache_ttl("public, max-age=3600") == 3600
+        assert _cache_ttl("private, max-age=3600") == 0
+        assert _cache_ttl("no-store") == 0
+        assert _cache_ttl("") == 0
+
+    def test_asset_route_only_matches_static_assets(self):
+        """Test only JS/CSS/font URLs are routed through the asset cache."""
+        from core.search_scout import _ASSET_URL_RE
+
+        assert _ASSET_URL_RE.search("https://cdn.test/js/app.min.js?v=3")
+        assert _ASSET_URL_RE.search("https://cdn.test/css/site.CSS")
+        assert _ASSET_URL_RE.search("https://cdn.test/fonts/icons.woff2")
+        assert not _ASSET_URL_RE.search("https://realtyassistant.in/properties?city=10")
+        assert not _ASSET_URL_RE.search("https://cdn.test/img/hero.jpg")
+        assert not _ASSET_URL_RE.search("https://api.test/search.json")
+
+
+# =============================================================================
+# Voice Handler Tests
+# =============================================================================
+
+class TestVoiceHandler:
+    """Tests for voice speech matching."""
+    
+    @pytest.fixture
+    def handler(self):
+        """Create a voice handler without engines."""
+        return VoiceHandler()
+    
+    def test_longest_city_variation_wins(self, handler):
+        """Test multi-word city names beat their shorter substrings."""
+        assert handler._match_city("looking in greater noida")[0] == "Greater Noida"
+        assert handler._match_city("noida sector 62")[0] == "Noida"
+        assert handler._match_city("andheri east") == ("mumbai", 0.9)
+    
+    def test_refusal_beats_polite_yes_words(self, handler):
+        """Test a refusal containing "please" is not read as consent."""
+        assert handler._match_consent("no please don't call") == (False, 0.95)
+        assert handler._match_consent("yes please") == (True, 0.95)
+    
+    def test_longest_property_type_variation_wins(self, handler):
+        """Test "studio apartment" is a studio, not an apartment."""
+        ptype, _ = handler._match_property_type("studio apartment", "Residential Properties")
+        assert ptype == "Residential Studio"
+    
+    @pytest.mark.asyncio
+    async def test_same_session_turns_are_serialized(self, handler):
+        """Test overlapping turns for one session don't skip a stage."""
+        await asyncio.gather(
+            handler.process_speech("call-1", "yes speaking"),
+            handler.process_speech("call-1", "yes I am interested"),
+        )
+        assert handler.sessions["call-1"].current_stage == "location"
+        
+        handler.clear_session("call-1")
+        assert "call-1" not in handler._session_locks
+    
+    @pytest.mark.asyncio
+    async def test_interpretation_reads_llm_response_text(self, mock_llm_engine):
+        """Test unclear input is interpreted from the LLMResponse text."""
+        mock_llm_engine.generate.return_value = LLMResponse(
+            text=" Noida ",
+            provider=LLMProvider.OLLAMA,
+            latency_ms=50,
+            tokens_used=2,
+            success=True
+        )
+        handler = VoiceHandler(llm_engine=mock_llm_engine)
+        
+        result = await handler._interpret_unclear_input(None, "noyda", "city name")
+        
+        assert result == "Noida"
+        assert mock_llm_engine.generate.call_args.kwargs["system_prompt"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_unclear_input_reuses_interpretation(self, mock_llm_engine):
+        """Test the same garble is sent to the LLM only once."""
+        mock_llm_engine.generate.return_value = LLMResponse(
+            text="3 BHK",
+            provider=LLMProvider.OLLAMA,
+            latency_ms=50,
+            tokens_used=2,
+            success=True
+        )
+        handler = VoiceHandler(llm_engine=mock_llm_engine)
+
+        first = await handler._interpret_unclear_input(None, "3B edge game", "bedrooms")
+        second = await handler._interpret_unclear_input(None, "3b Edge game!", "bedrooms")
+
+        assert first == second == "3 BHK"
+        assert mock_llm_engine.generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_unclear_input_shares_one_request(self, mock_llm_engine):
+        """Test simultaneous callers with the same garble wait on one LLM call."""
+        async def slow_generate(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return LLMResponse(
+                text="Noida",
+                provider=LLMProvider.OLLAMA,
+                latency_ms=10,
+                tokens_used=1,
+                success=True
+            )
+
+        mock_llm_engine.generate = AsyncMock(side_effect=slow_generate)
+        handler = VoiceHandler(llm_engine=mock_llm_engine)
+
+        results = await asyncio.gather(*(
+            handler._interpret_unclear_input(None, "noyda", "city name") for _ in range(5)
+        ))
+
+        assert results == ["Noida"] * 5
+        assert mock_llm_engine.generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_name_prefix_stripped_as_whole_words(self, handler):
+        """Test "my name is" is dropped but names starting with "its" are kept."""
+        session = handler.get_session("call-2")
+        
+        await handler._handle_ask_name(session, "My name is Priya, nice to meet you")
+        assert session.collected_data['name'] == "Priya"
+        
+        await handler._handle_ask_name(session, "Itsuki")
+        assert session.collected_data['name'] == "Itsuki"
+    
+    def test_fallback_session_store_is_bounded(self):
+        """Test the LRU session store evicts least recently stored calls."""
+        sessions = _LRUSessions(maxsize=2)
+        sessions["a"] = 1
+        sessions["b"] = 2
+        sessions["a"] = 1  # refreshed, so "b" is now oldest
+        sessions["c"] = 3
+        assert list(sessions) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_prewarmed_messages_are_real_replies(self, handler):
+        """Test every phrase prewarmed for TTS is returned by some handler path."""
+        # (stage, session data, retries already used, speech)
+        paths = [
+            (VoiceStage.GREETING, {'awaiting_name': True}, 0, ""),
+            (VoiceStage.GREETING, {'name': 'Asha', 'introduced': True}, 0, "yes"),
+            (VoiceStage.GREETING, {'name': 'Asha'}, 0, "purple monkey dishwasher"),
+            (VoiceStage.INTEREST_CHECK, {}, 0, "searching for a flat"),
+            (VoiceStage.INTEREST_CHECK, {}, 0, "purple monkey dishwasher"),
+            (VoiceStage.LOCATION, {}, 0, "xq"),
+            (VoiceStage.PROPERTY_CATEGORY, {}, 0, "commercial"),
+            (VoiceStage.PROPERTY_CATEGORY, {}, 0, "residential"),
+            (VoiceStage.PROPERTY_CATEGORY, {}, 3, "xq"),
+            (VoiceStage.PROPERTY_CATEGORY, {}, 0, "xq"),
+            (VoiceStage.VERIFY_REQUIREMENTS, {}, 0, "no"),
+            (VoiceStage.SEARCH_COMPLETE, {}, 0, "yes"),
+            (VoiceStage.SEARCH_COMPLETE, {}, 0, "no"),
+            (VoiceStage.SEARCH_COMPLETE, {}, 0, "purple monkey dishwasher"),
+            (VoiceStage.ASK_NAME, {}, 0, ""),
+            (VoiceStage.THANK_YOU, {}, 0, ""),
+        ]
+        replies = {handler.ERROR_RESPONSE.message}
+        for i, (stage, data, retries, speech) in enumerate(paths):
+            session = handler.get_session(f"prewarm-{i}")
+            session.current_stage = stage
+            session.collected_data.update(data)
+            session.retry_count = retries
+            response = await handler._stage_handlers[stage](session, speech)
+            replies.add(response.message)
+
+        assert set(VoiceHandler.static_messages()) <= replies
+
+    @pytest.mark.asyncio
+    async def test_tts_disk_cache_holds_only_prewarmed_phrases(self, tmp_path):
+        """Test replies with caller details stay in memory, off disk."""
+        from core.tts_engine import TTSEngine
+
+        class FakeTTS:
+            def __init__(self, text, lang, tld):
+                self.text = text
+
+            def write_to_fp(self, fp):
+                fp.write(self.text.encode())
+
+        (tmp_path / "stale.mp3").write_bytes(b"old reply")
+        engine = TTSEngine(cache_dir=str(tmp_path))
+
+        with patch.dict(sys.modules, {"gtts": Mock(gTTS=FakeTTS)}):
+            await engine.prewarm(["Which city?"])
+            audio = engine.synthesize("Thank you, Priya! We'll call 9876543210.")
+
+        assert audio is not None
+        assert [f.name for f in tmp_path.iterdir()] == [f"{engine._cache_key('Which city?')}.mp3"]
+
+
+# =============================================================================
+# Lead Database Tests
+# =============================================================================
+
+class TestLeadDatabase:
+    """Tests for the lead database's writer/reader split."""
+
+    def test_read_pool_round_trip(self, tmp_path):
+        """Test leads written on the writer are served from the read pool."""
+        from sqlalchemy import text
+        from sqlalchemy.exc import OperationalError
+        from core.database import LeadDatabase
+
+        db = LeadDatabase(f"sqlite:///{tmp_path / 'leads.db'}")
+        try:
+            assert db.read_engine is not db.engine
+
+            db.create_lead({"session_id": "s1", "name": "Asha", "qualified": True})
+            assert db.get_lead("s1")["name"] == "Asha"
+            assert db.get_leads_count() == 1
+            assert db.get_leads_count(qualified_only=True) == 1
+
+            with db.get_read_session() as session:
+                with pytest.raises(OperationalError):
+                    session.execute(text("DELETE FROM leads"))
+
+            assert db.delete_lead("s1") is True
+            assert db.get_lead("s1") is None
+            assert db.get_leads_count() == 0
+        finally:
+            db.dispose()
+
+    def test_in_memory_reads_through_writer(self):
+        """Test in-memory SQLite shares the writer instead of a reader pool."""
+        from core.database import LeadDatabase
+
+        db = LeadDatabase("sqlite:///:memory:")
+        assert db.read_engine is db.engine
+
+        db.create_lead({"session_id": "s1"})
+        assert db.get_lead("s1") is not None
+
+    def test_unhealthy_instance_is_disposed(self):
+        """Test get_database() releases the old pools before replacing them."""
+        import core.database as database
+
+        old = Mock(is_healthy=Mock(return_value=False))
+        new = Mock()
+        with patch.object(database, "_db_instance", old), \
+                patch.object(database, "LeadDatabase", return_value=new):
+            assert database.get_database() is new
+
+        old.dispose.assert_called_once()
+
 
 # =============================================================================
 # Integration Tests
@@ -433,9 +821,5 @@ class TestAPI:
 # =============================================================================
 
 if __name__ == "__main__":
-    # Create test directories
-    Path("tests/data/logs").mkdir(parents=True, exist_ok=True)
-    Path("tests/data/leads").mkdir(parents=True, exist_ok=True)
-    
     # Run tests
     pytest.main([__file__, "-v", "--tb=short"])